@@ -9,84 +9,99 @@ since it runs as a standalone CLI command. Config values are read from env vars.
 
 import json
 import os
-import subprocess
 import sys
 import time
+from pathlib import Path
+from typing import Any
 
-import libtmux
-from simple_term_menu import TerminalMenu
-
-from .utils import ccbot_dir
+from .utils import ccbot_dir, exec_tmux, list_tmux_windows
 
 _SESSION_NAME = os.getenv("TMUX_SESSION_NAME", "ccbot")
 _MAIN_WINDOW_NAME = "__main__"
 
+# path -> (st_mtime_ns, st_size, parsed JSON); unchanged files skip read + parse
+_json_cache: dict[Path, tuple[int, int, Any]] = {}
+
+
+def _load_json_cached(path: Path) -> Any:
+    """Load a JSON file, reusing the parsed result while mtime and size match.
+
+    Raises OSError / json.JSONDecodeError like a plain read would.
+    """
+    st = path.stat()
+    cached = _json_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = json.loads(path.read_text())
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 def _get_bound_window_ids() -> set[str]:
     """Read state.json and return window IDs that are bound to a Telegram topic."""
     state_file = ccbot_dir() / "state.json"
     try:
-        state = json.loads(state_file.read_text())
+        state = _load_json_cached(state_file)
     except (OSError, json.JSONDecodeError):
         return set()
 
-    bound: set[str] = set()
-    for bindings in state.get("thread_bindings", {}).values():
-        for wid in bindings.values():
-            bound.add(wid)
-    return bound
+    return {
+        wid
+        for bindings in state.get("thread_bindings", {}).values()
+        for wid in bindings.values()
+    }
 
 
 def _get_session_map() -> dict[str, dict[str, str]]:
     """Read session_map.json for cwd info."""
     map_file = ccbot_dir() / "session_map.json"
     try:
-        return json.loads(map_file.read_text())  # type: ignore[no-any-return]
+        return _load_json_cached(map_file)  # type: ignore[no-any-return]
     except (OSError, json.JSONDecodeError):
         return {}
 
 
 def attach_session_main() -> None:
     """CLI entry point for `ccbot attach`."""
-    server = libtmux.Server()
-    session = server.sessions.get(session_name=_SESSION_NAME)
-    if not session:
+    all_windows = list_tmux_windows(_SESSION_NAME)
+    if all_windows is None:
         print(f"No tmux session '{_SESSION_NAME}' found.", file=sys.stderr)
         sys.exit(1)
 
-    windows = [w for w in session.windows if w.window_name != _MAIN_WINDOW_NAME]
+    windows = [(wid, name) for wid, name in all_windows if name != _MAIN_WINDOW_NAME]
     if not windows:
         print("No windows available.")
         sys.exit(0)
 
-    bound_ids = _get_bound_window_ids()
-    session_map = _get_session_map()
-
     # Auto-attach if only one window
     if len(windows) == 1:
-        window = windows[0]
-        wid = window.window_id or ""
-        print(f"Attaching to '{window.window_name}' ({wid})")
+        wid, name = windows[0]
+        print(f"Attaching to '{name}' ({wid})")
         _attach(wid)
         return
 
-    # Build menu entries
+    # State files are only needed to annotate the menu
+    bound_ids = _get_bound_window_ids()
+    session_map = _get_session_map()
+
+    # Build menu entries (session_map keys are "<session>:<window_id>")
+    key_prefix = f"{_SESSION_NAME}:"
     entries: list[str] = []
-    for w in windows:
-        wid = w.window_id or ""
-        name = w.window_name or ""
-        map_key = f"{_SESSION_NAME}:{wid}"
-        cwd = session_map.get(map_key, {}).get("cwd", "")
+    for wid, name in windows:
+        info = session_map.get(key_prefix + wid)
+        cwd = info.get("cwd", "") if info else ""
         tag = " [T]" if wid in bound_ids else ""
         entries.append(f"{name}   ({wid})  {cwd}{tag}")
 
+    # Imported here: only the interactive menu path needs it
+    from simple_term_menu import TerminalMenu
+
     menu = TerminalMenu(entries, title="Available windows:")
     idx = menu.show()
     if idx is None:
         sys.exit(0)
 
-    window = windows[idx]  # type: ignore[index]
-    wid = window.window_id or ""
+    wid, _name = windows[idx]  # type: ignore[index]
     _attach(wid)
 
 
@@ -95,14 +110,22 @@ def _attach(window_id: str) -> None:
     target = f"{_SESSION_NAME}:{window_id}"
     if os.environ.get("TMUX"):
         # Already inside tmux — switch to the window
-        os.execvp("tmux", ["tmux", "switch-client", "-t", target])
+        exec_tmux(["switch-client", "-t", target])
     else:
         # Outside tmux — create a grouped session (independent current-window)
         # and select the chosen window. Session auto-destroys on detach.
         suffix = f"{window_id.lstrip('@')}-{int(time.time()) % 10000}"
         session_name = f"{_SESSION_NAME}-{suffix}"
-        os.execvp("tmux", [
-            "tmux", "new-session", "-t", _SESSION_NAME,
-            "-s", session_name,
-            ";", "select-window", "-t", window_id,
-        ])
+        exec_tmux(
+            [
+                "new-session",
+                "-t",
+                _SESSION_NAME,
+                "-s",
+                session_name,
+                ";",
+                "select-window",
+                "-t",
+                window_id,
+            ]
+        )
@@ -31,6 +31,8 @@ Key functions: create_bot(), handle_new_message().
 """
 
 import asyncio
+import functools
+import hashlib
 import io
 import logging
 import time
@@ -42,6 +44,7 @@ from telegram import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InputMediaDocument,
+    Message,
     Update,
 )
 from telegram.constants import ChatAction
@@ -226,11 +229,12 @@ async def screenshot_command(
 
     png_bytes = await text_to_image(text, with_ansi=True)
     keyboard = _build_screenshot_keyboard(wid)
-    await update.message.reply_document(
+    sent = await update.message.reply_document(
         document=io.BytesIO(png_bytes),
         filename="screenshot.png",
         reply_markup=keyboard,
     )
+    _remember_screenshot(sent.message_id, _pane_digest(text))
 
 
 async def unbind_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -364,8 +368,50 @@ _KEY_LABELS: dict[str, str] = {
 }
 
 
+# Screenshot message_id → digest of the pane text it shows. Lets refreshes skip
+# rendering and the edit round-trip when the pane hasn't changed (Telegram
+# rejects identical edits anyway). Oldest entries are evicted past the cap.
+_screenshot_digests: dict[int, bytes] = {}
+_SCREENSHOT_DIGESTS_MAX = 256
+
+
+def _pane_digest(text: str) -> bytes:
+    """64-bit digest of captured pane text."""
+    return hashlib.blake2b(text.encode(), digest_size=8).digest()
+
+
+def _remember_screenshot(message_id: int, digest: bytes) -> None:
+    """Record what a screenshot message currently shows."""
+    _screenshot_digests.pop(message_id, None)
+    _screenshot_digests[message_id] = digest
+    if len(_screenshot_digests) > _SCREENSHOT_DIGESTS_MAX:
+        _screenshot_digests.pop(next(iter(_screenshot_digests)))
+
+
+# Interactive UI callback prefix → (tmux_key, answer toast). Each of these keys
+# is sent to the window and the UI is re-rendered; Esc and refresh are separate.
+_ASK_NAV_KEYS: dict[str, tuple[str, str | None]] = {
+    CB_ASK_UP: ("Up", None),
+    CB_ASK_DOWN: ("Down", None),
+    CB_ASK_LEFT: ("Left", None),
+    CB_ASK_RIGHT: ("Right", None),
+    CB_ASK_ENTER: ("Enter", "⏎ Enter"),
+    CB_ASK_SPACE: ("Space", "␣ Space"),
+    CB_ASK_TAB: ("Tab", "⇥ Tab"),
+}
+
+
+def _callback_action_prefix(data: str) -> str:
+    """Return the leading '<ns>:<action>:' of callback data ('' if absent)."""
+    return data[: data.find(":", data.find(":") + 1) + 1]
+
+
+@functools.lru_cache(maxsize=128)
 def _build_screenshot_keyboard(window_id: str) -> InlineKeyboardMarkup:
-    """Build inline keyboard for screenshot: control keys + refresh."""
+    """Build inline keyboard for screenshot: control keys + refresh.
+
+    Memoized per window_id — rebuilt on every key press/refresh otherwise.
+    """
 
     def btn(label: str, key_id: str) -> InlineKeyboardButton:
         return InlineKeyboardButton(
@@ -465,8 +511,7 @@ async def forward_command_handler(
     logger.info(
         "Forwarding command %s to window %s (user=%d)", cc_slash, display, user.id
     )
-    await update.message.chat.send_action(ChatAction.TYPING)
-    success, message = await session_manager.send_to_window(wid, cc_slash)
+    success, message = await _send_to_window_typing(update.message, wid, cc_slash)
     if success:
         await safe_reply(update.message, f"⚡ [{display}] Sent: {cc_slash}")
         # If /clear command was sent, clear the session association
@@ -564,10 +609,9 @@ async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     else:
         text_to_send = f"(image attached: {file_path})"
 
-    await update.message.chat.send_action(ChatAction.TYPING)
     clear_status_msg_info(user.id, thread_id)
 
-    success, message = await session_manager.send_to_window(wid, text_to_send)
+    success, message = await _send_to_window_typing(update.message, wid, text_to_send)
     if not success:
         await safe_reply(update.message, f"❌ {message}")
         return
@@ -580,6 +624,30 @@ async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 _bash_capture_tasks: dict[tuple[int, int], asyncio.Task[None]] = {}
 
 
+async def _send_to_window_typing(
+    message: Message, window_id: str, text: str
+) -> tuple[bool, str]:
+    """Forward text to a window while showing the typing indicator.
+
+    The chat action and the tmux send are independent, so they run
+    concurrently instead of the keystrokes waiting on a Telegram round-trip.
+    A failed typing indicator does not block forwarding.
+    """
+    typing, result = await asyncio.gather(
+        message.chat.send_action(ChatAction.TYPING),
+        session_manager.send_to_window(window_id, text),
+        return_exceptions=True,
+    )
+    if isinstance(result, BaseException):
+        raise result
+    if isinstance(typing, Exception):
+        logger.debug("Failed to send typing action: %s", typing)
+    if result[0] and session_monitor:
+        # A reply is coming — don't let it wait out an idle poll backoff
+        session_monitor.wake()
+    return result
+
+
 def _cancel_bash_capture(user_id: int, thread_id: int) -> None:
     """Cancel any running bash capture for this topic."""
     key = (user_id, thread_id)
@@ -689,8 +757,12 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     text = update.message.text
 
+    # Read the UI state once; the common case (no picker/browser open) then
+    # falls straight through to forwarding
+    state = context.user_data.get(STATE_KEY) if context.user_data else None
+
     # Ignore text in window picker mode (only for the same thread)
-    if context.user_data and context.user_data.get(STATE_KEY) == STATE_SELECTING_WINDOW:
+    if context.user_data and state == STATE_SELECTING_WINDOW:
         pending_tid = context.user_data.get("_pending_thread_id")
         if pending_tid == thread_id:
             await safe_reply(
@@ -702,11 +774,8 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         clear_window_picker_state(context.user_data)
         context.user_data.pop("_pending_thread_id", None)
 
-    # Ignore text in directory browsing mode (only for the same thread)
-    if (
-        context.user_data
-        and context.user_data.get(STATE_KEY) == STATE_BROWSING_DIRECTORY
-    ):
+    elif context.user_data and state == STATE_BROWSING_DIRECTORY:
+        # Ignore text in directory browsing mode (only for the same thread)
         pending_tid = context.user_data.get("_pending_thread_id")
         if pending_tid == thread_id:
             await safe_reply(
@@ -794,13 +863,12 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    await update.message.chat.send_action(ChatAction.TYPING)
     await enqueue_status_update(context.bot, user.id, wid, None, thread_id=thread_id)
 
     # Cancel any running bash capture — new message pushes pane content down
     _cancel_bash_capture(user.id, thread_id)
 
-    success, message = await session_manager.send_to_window(wid, text)
+    success, message = await _send_to_window_typing(update.message, wid, text)
     if not success:
         await safe_reply(update.message, f"❌ {message}")
         return
@@ -944,11 +1012,9 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             if context.user_data
             else default_path
         )
-        current = Path(current_path).resolve()
-        parent = current.parent
+        # BROWSE_PATH_KEY always holds a resolved path, so the parent is too
         # No restriction - allow navigating anywhere
-
-        parent_path = str(parent)
+        parent_path = str(Path(current_path).parent)
         if context.user_data is not None:
             context.user_data[BROWSE_PATH_KEY] = parent_path
             context.user_data[BROWSE_PAGE_KEY] = 0
@@ -977,10 +1043,16 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             if context.user_data
             else default_path
         )
+        page_dirs: list[str] | None = (
+            context.user_data.get(BROWSE_DIRS_KEY) if context.user_data else None
+        )
         if context.user_data is not None:
             context.user_data[BROWSE_PAGE_KEY] = pg
 
-        msg_text, keyboard, subdirs = build_directory_browser(current_path, pg)
+        # Page flips reuse the listing cached for this path instead of rescanning
+        msg_text, keyboard, subdirs = build_directory_browser(
+            current_path, pg, subdirs=page_dirs
+        )
         if context.user_data is not None:
             context.user_data[BROWSE_DIRS_KEY] = subdirs
         await safe_edit(query, msg_text, reply_markup=keyboard)
@@ -1152,6 +1224,12 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             await query.answer("Failed to capture pane", show_alert=True)
             return
 
+        digest = _pane_digest(text)
+        msg_id = query.message.message_id if query.message else None
+        if msg_id is not None and _screenshot_digests.get(msg_id) == digest:
+            await query.answer("Already up to date")
+            return
+
         png_bytes = await text_to_image(text, with_ansi=True)
         keyboard = _build_screenshot_keyboard(window_id)
         try:
@@ -1161,6 +1239,8 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 ),
                 reply_markup=keyboard,
             )
+            if msg_id is not None:
+                _remember_screenshot(msg_id, digest)
             await query.answer("Refreshed")
         except Exception as e:
             logger.error(f"Failed to refresh screenshot: {e}")
@@ -1169,55 +1249,21 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     elif data == "noop":
         await query.answer()
 
-    # Interactive UI: Up arrow
-    elif data.startswith(CB_ASK_UP):
-        window_id = data[len(CB_ASK_UP) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(w.window_id, "Up", enter=False, literal=False)
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer()
-
-    # Interactive UI: Down arrow
-    elif data.startswith(CB_ASK_DOWN):
-        window_id = data[len(CB_ASK_DOWN) :]
+    # Interactive UI: navigation keys — send the key, then re-render the UI
+    elif (
+        nav_key := _ASK_NAV_KEYS.get(ask_prefix := _callback_action_prefix(data))
+    ) is not None:
+        tmux_key, toast = nav_key
+        window_id = data[len(ask_prefix) :]
         thread_id = _get_thread_id(update)
         w = await tmux_manager.find_window_by_id(window_id)
         if w:
             await tmux_manager.send_keys(
-                w.window_id, "Down", enter=False, literal=False
+                w.window_id, tmux_key, enter=False, literal=False
             )
             await asyncio.sleep(0.5)
             await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer()
-
-    # Interactive UI: Left arrow
-    elif data.startswith(CB_ASK_LEFT):
-        window_id = data[len(CB_ASK_LEFT) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(
-                w.window_id, "Left", enter=False, literal=False
-            )
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer()
-
-    # Interactive UI: Right arrow
-    elif data.startswith(CB_ASK_RIGHT):
-        window_id = data[len(CB_ASK_RIGHT) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(
-                w.window_id, "Right", enter=False, literal=False
-            )
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer()
+        await query.answer(toast)
 
     # Interactive UI: Escape
     elif data.startswith(CB_ASK_ESC):
@@ -1231,43 +1277,6 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             await clear_interactive_msg(user.id, context.bot, thread_id)
         await query.answer("⎋ Esc")
 
-    # Interactive UI: Enter
-    elif data.startswith(CB_ASK_ENTER):
-        window_id = data[len(CB_ASK_ENTER) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(
-                w.window_id, "Enter", enter=False, literal=False
-            )
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer("⏎ Enter")
-
-    # Interactive UI: Space
-    elif data.startswith(CB_ASK_SPACE):
-        window_id = data[len(CB_ASK_SPACE) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(
-                w.window_id, "Space", enter=False, literal=False
-            )
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer("␣ Space")
-
-    # Interactive UI: Tab
-    elif data.startswith(CB_ASK_TAB):
-        window_id = data[len(CB_ASK_TAB) :]
-        thread_id = _get_thread_id(update)
-        w = await tmux_manager.find_window_by_id(window_id)
-        if w:
-            await tmux_manager.send_keys(w.window_id, "Tab", enter=False, literal=False)
-            await asyncio.sleep(0.5)
-            await handle_interactive_ui(context.bot, user.id, window_id, thread_id)
-        await query.answer("⇥ Tab")
-
     # Interactive UI: refresh display
     elif data.startswith(CB_ASK_REFRESH):
         window_id = data[len(CB_ASK_REFRESH) :]
@@ -1304,25 +1313,32 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         # Refresh screenshot after key press
         await asyncio.sleep(0.5)
         text = await tmux_manager.capture_pane(w.window_id, with_ansi=True)
-        if text:
-            png_bytes = await text_to_image(text, with_ansi=True)
-            keyboard = _build_screenshot_keyboard(window_id)
-            try:
-                await query.edit_message_media(
-                    media=InputMediaDocument(
-                        media=io.BytesIO(png_bytes),
-                        filename="screenshot.png",
-                    ),
-                    reply_markup=keyboard,
-                )
-            except Exception:
-                pass  # Screenshot unchanged or message too old
+        if not text:
+            return
+        digest = _pane_digest(text)
+        msg_id = query.message.message_id if query.message else None
+        if msg_id is not None and _screenshot_digests.get(msg_id) == digest:
+            return  # Key press didn't change the pane
+        png_bytes = await text_to_image(text, with_ansi=True)
+        keyboard = _build_screenshot_keyboard(window_id)
+        try:
+            await query.edit_message_media(
+                media=InputMediaDocument(
+                    media=io.BytesIO(png_bytes),
+                    filename="screenshot.png",
+                ),
+                reply_markup=keyboard,
+            )
+            if msg_id is not None:
+                _remember_screenshot(msg_id, digest)
+        except Exception:
+            pass  # Screenshot unchanged or message too old
 
 
 # --- Streaming response / notifications ---
 
 
-async def handle_new_message(msg: NewMessage, bot: Bot) -> None:
+async def handle_new_message(msg: NewMessage, *, bot: Bot) -> None:
     """Handle a new assistant message — enqueue for sequential processing.
 
     Messages are queued per-user to ensure status messages always appear last.
@@ -1341,80 +1357,115 @@ async def handle_new_message(msg: NewMessage, bot: Bot) -> None:
         logger.info(f"No active users for session {msg.session_id}")
         return
 
-    for user_id, wid, thread_id in active_users:
-        # Handle interactive tools specially - capture terminal and send UI
-        if msg.tool_name in INTERACTIVE_TOOL_NAMES and msg.content_type == "tool_use":
-            # Mark interactive mode BEFORE sleeping so polling skips this window
-            set_interactive_mode(user_id, wid, thread_id)
-            # Flush pending messages (e.g. plan content) before sending interactive UI
-            queue = get_message_queue(user_id)
-            if queue:
-                await queue.join()
-            # Wait briefly for Claude Code to render the question UI
-            await asyncio.sleep(0.3)
-            handled = await handle_interactive_ui(bot, user_id, wid, thread_id)
-            if handled:
-                # Update user's read offset
-                session = await session_manager.resolve_session_for_window(wid)
-                if session and session.file_path:
-                    try:
-                        file_size = Path(session.file_path).stat().st_size
-                        session_manager.update_user_window_offset(
-                            user_id, wid, file_size
-                        )
-                    except OSError:
-                        pass
-                continue  # Don't send the normal tool_use message
-            else:
-                # UI not rendered — clear the early-set mode
-                clear_interactive_mode(user_id, thread_id)
-
-        # Any non-interactive message means the interaction is complete — delete the UI message
-        if get_interactive_msg_id(user_id, thread_id):
-            await clear_interactive_msg(user_id, bot, thread_id)
-
-        parts = build_response_parts(
+    # The rendered parts are identical for every user — build them once
+    parts = (
+        build_response_parts(
             msg.text,
             msg.is_complete,
             msg.content_type,
             msg.role,
         )
+        if msg.is_complete
+        else []
+    )
 
-        if msg.is_complete:
-            # Enqueue content message task
-            # Note: tool_result editing is handled inside _process_content_task
-            # to ensure sequential processing with tool_use message sending
-            await enqueue_content_message(
-                bot=bot,
-                user_id=user_id,
-                window_id=wid,
-                parts=parts,
-                tool_use_id=msg.tool_use_id,
-                content_type=msg.content_type,
-                text=msg.text,
-                thread_id=thread_id,
-                image_data=msg.image_data,
+    # Every matched window holds this session, so they share one transcript:
+    # locate it once for the read-offset updates instead of per user.
+    session_file = session_manager.get_session_file(active_users[0][1])
+
+    # Users are independent (separate queues/topics) — deliver concurrently so
+    # one user's interactive-UI wait or queue flush doesn't delay the others.
+    results = await asyncio.gather(
+        *(
+            _deliver_to_user(msg, bot, parts, session_file, user_id, wid, thread_id)
+            for user_id, wid, thread_id in active_users
+        ),
+        return_exceptions=True,
+    )
+    for (user_id, wid, _thread_id), result in zip(active_users, results):
+        if isinstance(result, Exception):
+            logger.error(
+                "Failed to deliver message to user %d (window %s): %s",
+                user_id,
+                wid,
+                result,
             )
 
-            # Update user's read offset to current file position
-            # This marks these messages as "read" for this user
-            session = await session_manager.resolve_session_for_window(wid)
-            if session and session.file_path:
-                try:
-                    file_size = Path(session.file_path).stat().st_size
-                    session_manager.update_user_window_offset(user_id, wid, file_size)
-                except OSError:
-                    pass
 
+async def _deliver_to_user(
+    msg: NewMessage,
+    bot: Bot,
+    parts: list[str],
+    session_file: Path | None,
+    user_id: int,
+    wid: str,
+    thread_id: int,
+) -> None:
+    """Route one new message to a single user's bound topic."""
+    # Handle interactive tools specially - capture terminal and send UI
+    if msg.tool_name in INTERACTIVE_TOOL_NAMES and msg.content_type == "tool_use":
+        # Mark interactive mode BEFORE sleeping so polling skips this window
+        set_interactive_mode(user_id, wid, thread_id)
+        # Flush pending messages (e.g. plan content) before sending interactive UI
+        queue = get_message_queue(user_id)
+        if queue:
+            await queue.join()
+        # Wait briefly for Claude Code to render the question UI
+        await asyncio.sleep(0.3)
+        handled = await handle_interactive_ui(bot, user_id, wid, thread_id)
+        if handled:
+            # Update user's read offset
+            _mark_session_read(user_id, wid, session_file)
+            return  # Don't send the normal tool_use message
+        else:
+            # UI not rendered — clear the early-set mode
+            clear_interactive_mode(user_id, thread_id)
+
+    # Any non-interactive message means the interaction is complete — delete the UI message
+    if get_interactive_msg_id(user_id, thread_id):
+        await clear_interactive_msg(user_id, bot, thread_id)
+
+    if msg.is_complete:
+        # Enqueue content message task
+        # Note: tool_result editing is handled inside _process_content_task
+        # to ensure sequential processing with tool_use message sending
+        await enqueue_content_message(
+            bot=bot,
+            user_id=user_id,
+            window_id=wid,
+            parts=parts,
+            tool_use_id=msg.tool_use_id,
+            content_type=msg.content_type,
+            text=msg.text,
+            thread_id=thread_id,
+            image_data=msg.image_data,
+        )
 
-# --- App lifecycle ---
+        # Update user's read offset to current file position
+        # This marks these messages as "read" for this user
+        _mark_session_read(user_id, wid, session_file)
 
 
-async def post_init(application: Application) -> None:
-    global session_monitor, _status_poll_task
+def _mark_session_read(user_id: int, wid: str, session_file: Path | None) -> None:
+    """Set the user's read offset for a window to the transcript's current size."""
+    if session_file is None:
+        return
+    try:
+        file_size = session_file.stat().st_size
+    except OSError:
+        return
+    session_manager.update_user_window_offset(user_id, wid, file_size)
 
-    await application.bot.delete_my_commands()
 
+# --- App lifecycle ---
+
+
+async def _register_bot_commands(bot: Bot) -> None:
+    """Set the bot's command menu to ours plus Claude Code commands.
+
+    set_my_commands replaces the whole list, so no delete is needed first;
+    the set itself is skipped when Telegram already has the same menu.
+    """
     bot_commands = [
         BotCommand("start", "Show welcome message"),
         BotCommand("history", "Message history for this topic"),
@@ -1428,10 +1479,25 @@ async def post_init(application: Application) -> None:
     for cmd_name, desc in CC_COMMANDS.items():
         bot_commands.append(BotCommand(cmd_name, desc))
 
-    await application.bot.set_my_commands(bot_commands)
+    current = await bot.get_my_commands()
+    if [(c.command, c.description) for c in current] == [
+        (c.command, c.description) for c in bot_commands
+    ]:
+        logger.debug("Bot commands unchanged, skipping set_my_commands")
+        return
+    await bot.set_my_commands(bot_commands)
+
 
-    # Re-resolve stale window IDs from persisted state against live tmux windows
-    await session_manager.resolve_stale_ids()
+async def post_init(application: Application) -> None:
+    global session_monitor, _status_poll_task
+
+    # Command registration (Telegram round trips) and re-resolving stale
+    # window IDs from persisted state against live tmux windows are
+    # independent — run them concurrently.
+    await asyncio.gather(
+        _register_bot_commands(application.bot),
+        session_manager.resolve_stale_ids(),
+    )
 
     # Pre-fill global rate limiter bucket on restart.
     # AsyncLimiter starts at _level=0 (full burst capacity), but Telegram's
@@ -1446,10 +1512,9 @@ async def post_init(application: Application) -> None:
 
     monitor = SessionMonitor()
 
-    async def message_callback(msg: NewMessage) -> None:
-        await handle_new_message(msg, application.bot)
-
-    monitor.set_message_callback(message_callback)
+    monitor.set_message_callback(
+        functools.partial(handle_new_message, bot=application.bot)
+    )
     monitor.start()
     session_monitor = monitor
     logger.info("Session monitor started")
@@ -1479,11 +1544,20 @@ async def post_shutdown(application: Application) -> None:
         session_monitor.stop()
         logger.info("Session monitor stopped")
 
+    session_manager.save_if_dirty()
+
 
 def create_bot() -> Application:
     application = (
         Application.builder()
         .token(config.telegram_bot_token)
+        # Bursts (history pages, per-user fan-out, callback storms) share one
+        # keep-alive pool; wait for a free connection instead of failing after
+        # PTB's 1s default pool timeout. getUpdates only ever needs one.
+        .connection_pool_size(256)
+        .pool_timeout(30)
+        .get_updates_connection_pool_size(1)
+        # AIORateLimiter defaults to Telegram's 30 msg/s global limit
         .rate_limiter(AIORateLimiter(max_retries=5))
         .post_init(post_init)
         .post_shutdown(post_shutdown)
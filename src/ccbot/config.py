@@ -57,6 +57,10 @@ class Config:
         # Tmux session name and window naming
         self.tmux_session_name = os.getenv("TMUX_SESSION_NAME", "ccbot")
         self.tmux_main_window_name = "__main__"
+        # Size of the detached session grid; tmux would otherwise pick a large
+        # default that it keeps emulating even though nobody is attached.
+        self.tmux_window_width = int(os.getenv("CCBOT_TMUX_WIDTH", "200"))
+        self.tmux_window_height = int(os.getenv("CCBOT_TMUX_HEIGHT", "50"))
 
         # Claude command to run in new windows
         self.claude_command = os.getenv("CLAUDE_COMMAND", "claude")
@@ -80,6 +84,11 @@ class Config:
             self.claude_projects_path = Path.home() / ".claude" / "projects"
 
         self.monitor_poll_interval = float(os.getenv("MONITOR_POLL_INTERVAL", "2.0"))
+        # Idle cycles back off from monitor_poll_interval up to this cap
+        self.monitor_max_poll_interval = max(
+            self.monitor_poll_interval,
+            float(os.getenv("MONITOR_MAX_POLL_INTERVAL", "10.0")),
+        )
 
         # Display user messages in history and real-time notifications
         # When True, user messages are shown with a 👤 prefix
@@ -13,6 +13,9 @@ Key components:
   - clear_browse_state: Clear browsing state from user_data
 """
 
+import functools
+import os
+import time
 from pathlib import Path
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
@@ -30,6 +33,19 @@ from .callback_data import (
 # Directories per page in directory browser
 DIRS_PER_PAGE = 12
 
+# Seconds a directory listing is reused across renders (pagination, re-entry)
+LISTING_TTL = 5
+
+# Button labels longer than this are cut to LABEL_MAX_LEN - 1 chars plus "…"
+LABEL_MAX_LEN = 13
+
+# Home directory, shown as "~" in displayed paths (resolved once per process)
+_HOME = str(Path.home())
+
+# Button icon prefixes
+WINDOW_ICON = "🖥 "
+DIR_ICON = "📁 "
+
 # User state keys
 STATE_KEY = "state"
 STATE_BROWSING_DIRECTORY = "browsing_directory"
@@ -40,6 +56,43 @@ BROWSE_DIRS_KEY = "browse_dirs"  # Cache of subdirs for current path
 UNBOUND_WINDOWS_KEY = "unbound_windows"  # Cache of (name, cwd) tuples
 
 
+@functools.lru_cache(maxsize=1024)
+def _button_label(icon: str, name: str) -> str:
+    """Icon-prefixed, shortened inline button text (cached per icon/name)."""
+    if len(name) > LABEL_MAX_LEN:
+        return f"{icon}{name[: LABEL_MAX_LEN - 1]}…"
+    return icon + name
+
+
+@functools.lru_cache(maxsize=256)
+def _list_subdirs_cached(path_str: str, bucket: int) -> tuple[str, ...]:
+    """Sorted visible subdirectory names of path_str.
+
+    ``bucket`` is the current LISTING_TTL time slice, so entries expire
+    when it rolls over. Raises OSError if the directory can't be read.
+    """
+    # scandir's DirEntry.is_dir() uses the dirent type from the directory read;
+    # only symlinks need a stat (kept followed so linked project dirs still show)
+    with os.scandir(path_str) as entries:
+        return tuple(
+            sorted(
+                e.name
+                for e in entries
+                if (config.show_hidden_dirs or not e.name.startswith("."))
+                and e.is_dir()
+            )
+        )
+
+
+def _list_subdirs(path: Path) -> list[str]:
+    """List subdirectories, reusing a listing made within the last LISTING_TTL."""
+    try:
+        bucket = int(time.monotonic() // LISTING_TTL)
+        return list(_list_subdirs_cached(str(path), bucket))
+    except OSError:
+        return []
+
+
 def clear_browse_state(user_data: dict | None) -> None:
     """Clear directory browsing state keys from user_data."""
     if user_data is not None:
@@ -66,26 +119,36 @@ def build_window_picker(
 
     Returns: (text, keyboard, window_ids) where window_ids is the ordered list for caching.
     """
-    window_ids = [wid for wid, _, _ in windows]
+    text, keyboard = _render_window_picker(tuple(windows))
+    return text, keyboard, [wid for wid, _, _ in windows]
+
 
+@functools.lru_cache(maxsize=128)
+def _render_window_picker(
+    windows: tuple[tuple[str, str, str], ...],
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Render picker text + keyboard; the window tuple is the cache fingerprint.
+
+    Every message in an unbound topic re-shows the picker, usually for the
+    same set of windows, so an unchanged set reuses the previous render.
+    """
     lines = [
         "*Bind to Existing Window*\n",
         "These windows are running but not bound to any topic.",
         "Pick one to attach it here, or start a new session.\n",
     ]
     for _wid, name, cwd in windows:
-        display_cwd = cwd.replace(str(Path.home()), "~")
+        display_cwd = cwd.replace(_HOME, "~")
         lines.append(f"• `{name}` — {display_cwd}")
 
     buttons: list[list[InlineKeyboardButton]] = []
     for i in range(0, len(windows), 2):
         row = []
         for j in range(min(2, len(windows) - i)):
-            name = windows[i + j][1]
-            display = name[:12] + "…" if len(name) > 13 else name
             row.append(
                 InlineKeyboardButton(
-                    f"🖥 {display}", callback_data=f"{CB_WIN_BIND}{i + j}"
+                    _button_label(WINDOW_ICON, windows[i + j][1]),
+                    callback_data=f"{CB_WIN_BIND}{i + j}",
                 )
             )
         buttons.append(row)
@@ -96,32 +159,26 @@ def build_window_picker(
         ]
     )
 
-    text = "\n".join(lines)
-    return text, InlineKeyboardMarkup(buttons), window_ids
+    return "\n".join(lines), InlineKeyboardMarkup(buttons)
 
 
 def build_directory_browser(
-    current_path: str, page: int = 0
+    current_path: str, page: int = 0, subdirs: list[str] | None = None
 ) -> tuple[str, InlineKeyboardMarkup, list[str]]:
     """Build directory browser UI.
 
+    Pass the cached ``subdirs`` of ``current_path`` (e.g. when flipping
+    pages) to skip re-listing the directory; only the page is sliced.
+
     Returns: (text, keyboard, subdirs) where subdirs is the full list for caching.
     """
     path = Path(current_path).expanduser().resolve()
     if not path.exists() or not path.is_dir():
         path = Path.cwd()
+        subdirs = None
 
-    try:
-        subdirs = sorted(
-            [
-                d.name
-                for d in path.iterdir()
-                if d.is_dir()
-                and (config.show_hidden_dirs or not d.name.startswith("."))
-            ]
-        )
-    except (PermissionError, OSError):
-        subdirs = []
+    if subdirs is None:
+        subdirs = _list_subdirs(path)
 
     total_pages = max(1, (len(subdirs) + DIRS_PER_PAGE - 1) // DIRS_PER_PAGE)
     page = max(0, min(page, total_pages - 1))
@@ -132,12 +189,12 @@ def build_directory_browser(
     for i in range(0, len(page_dirs), 2):
         row = []
         for j, name in enumerate(page_dirs[i : i + 2]):
-            display = name[:12] + "…" if len(name) > 13 else name
             # Use global index (start + i + j) to avoid long dir names in callback_data
             idx = start + i + j
             row.append(
                 InlineKeyboardButton(
-                    f"📁 {display}", callback_data=f"{CB_DIR_SELECT}{idx}"
+                    _button_label(DIR_ICON, name),
+                    callback_data=f"{CB_DIR_SELECT}{idx}",
                 )
             )
         buttons.append(row)
@@ -164,7 +221,7 @@ def build_directory_browser(
     action_row.append(InlineKeyboardButton("Select", callback_data=CB_DIR_CONFIRM))
     buttons.append(action_row)
 
-    display_path = str(path).replace(str(Path.home()), "~")
+    display_path = str(path).replace(_HOME, "~")
     if not subdirs:
         text = f"*Select Working Directory*\n\nCurrent: `{display_path}`\n\n_(No subdirectories)_"
     else:
@@ -14,7 +14,7 @@ from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 
 from ..config import config
 from ..session import session_manager
-from ..telegram_sender import split_message
+from ..telegram_sender import split_paragraphs
 from ..transcript_parser import TranscriptParser
 from .callback_data import CB_HISTORY_NEXT, CB_HISTORY_PREV
 from .message_sender import safe_edit, safe_reply, safe_send
@@ -195,8 +195,7 @@ async def send_history(
                 lines.append(f"∴ Thinking…\n{msg_text}")
             else:
                 lines.append(msg_text)
-        full_text = "\n\n".join(lines)
-        pages = split_message(full_text, max_length=4096)
+        pages = split_paragraphs(lines, max_length=4096)
 
         # Default to last page (newest messages) for both history and unread
         if offset < 0:
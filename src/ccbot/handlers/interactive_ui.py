@@ -14,6 +14,7 @@ Provides:
 State dicts are keyed by (user_id, thread_id_or_0) for Telegram topic support.
 """
 
+import functools
 import logging
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
@@ -45,6 +46,9 @@ _interactive_msgs: dict[tuple[int, int], int] = {}
 # Track interactive mode: (user_id, thread_id_or_0) -> window_id
 _interactive_mode: dict[tuple[int, int], str] = {}
 
+# Last shown interactive content: (user_id, thread_id_or_0) -> (text, keyboard)
+_interactive_rendered: dict[tuple[int, int], tuple[str, InlineKeyboardMarkup]] = {}
+
 
 def get_interactive_window(user_id: int, thread_id: int | None = None) -> str | None:
     """Get the window_id for user's interactive mode."""
@@ -77,6 +81,7 @@ def get_interactive_msg_id(user_id: int, thread_id: int | None = None) -> int |
     return _interactive_msgs.get((user_id, thread_id or 0))
 
 
+@functools.lru_cache(maxsize=128)
 def _build_interactive_keyboard(
     window_id: str,
     ui_name: str = "",
@@ -85,6 +90,9 @@ def _build_interactive_keyboard(
 
     ``ui_name`` controls the layout: ``RestoreCheckpoint`` omits ←/→ keys
     since only vertical selection is needed.
+
+    Memoized: the markup depends only on the arguments and Telegram objects
+    are immutable, so every key press on the same UI reuses one instance.
     """
     vertical_only = ui_name == "RestoreCheckpoint"
 
@@ -192,6 +200,10 @@ async def handle_interactive_ui(
     # Check if we have an existing interactive message to edit
     existing_msg_id = _interactive_msgs.get(ikey)
     if existing_msg_id:
+        if _interactive_rendered.get(ikey) == (text, keyboard):
+            # Same text and markup already displayed — skip the no-op edit
+            _interactive_mode[ikey] = window_id
+            return True
         try:
             await bot.edit_message_text(
                 chat_id=chat_id,
@@ -201,6 +213,7 @@ async def handle_interactive_ui(
                 link_preview_options=NO_LINK_PREVIEW,
             )
             _interactive_mode[ikey] = window_id
+            _interactive_rendered[ikey] = (text, keyboard)
             return True
         except Exception:
             # Message unchanged or other error - silently ignore, don't send new
@@ -224,6 +237,7 @@ async def handle_interactive_ui(
     if sent:
         _interactive_msgs[ikey] = sent.message_id
         _interactive_mode[ikey] = window_id
+        _interactive_rendered[ikey] = (text, keyboard)
         return True
     return False
 
@@ -237,6 +251,7 @@ async def clear_interactive_msg(
     ikey = (user_id, thread_id or 0)
     msg_id = _interactive_msgs.pop(ikey, None)
     _interactive_mode.pop(ikey, None)
+    _interactive_rendered.pop(ikey, None)
     logger.debug(
         "Clear interactive msg: user=%d, thread=%s, msg_id=%s",
         user_id,
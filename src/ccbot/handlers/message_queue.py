@@ -4,6 +4,7 @@ Provides a queue-based message processing system that ensures:
   - Messages are sent in receive order (FIFO)
   - Status messages always follow content messages
   - Consecutive content messages can be merged for efficiency
+  - Consecutive status updates for a topic collapse to the latest one
   - Thread-aware sending: each MessageTask carries an optional thread_id
     for Telegram topic support
 
@@ -20,8 +21,9 @@ Key components:
 import asyncio
 import logging
 import time
+from collections.abc import Coroutine
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 from telegram import Bot
 from telegram.constants import ChatAction
@@ -186,6 +188,45 @@ async def _merge_content_tasks(
     )
 
 
+async def _coalesce_status_tasks(
+    queue: asyncio.Queue[MessageTask],
+    first: MessageTask,
+    lock: asyncio.Lock,
+) -> tuple[MessageTask, int]:
+    """Collapse back-to-back status updates for the same thread into the last.
+
+    During bursts the poller can queue several status updates for one topic
+    before the worker catches up; only the newest matters, so the stale ones
+    are skipped instead of each costing a Telegram API call. A status_clear
+    ends the run: it must still delete the old message so the next status
+    is sent below the user's new input rather than edited in place above it.
+
+    Returns: (latest_task, skip_count) — same queue counter management as
+    _merge_content_tasks.
+    """
+    latest = first
+    skip_count = 0
+    if first.task_type != "status_update":
+        return latest, skip_count
+
+    async with lock:
+        items = _inspect_queue(queue)
+        remaining: list[MessageTask] = []
+
+        for i, task in enumerate(items):
+            if task.task_type != "status_update" or task.thread_id != first.thread_id:
+                remaining = items[i:]
+                break
+            latest = task
+            skip_count += 1
+
+        for item in remaining:
+            queue.put_nowait(item)
+            queue.task_done()
+
+    return latest, skip_count
+
+
 async def _message_queue_worker(bot: Bot, user_id: int) -> None:
     """Process message tasks for a user sequentially."""
     queue = _message_queues[user_id]
@@ -226,10 +267,16 @@ async def _message_queue_worker(bot: Bot, user_id: int) -> None:
                         for _ in range(merge_count):
                             queue.task_done()
                     await _process_content_task(bot, user_id, merged_task)
-                elif task.task_type == "status_update":
-                    await _process_status_update_task(bot, user_id, task)
-                elif task.task_type == "status_clear":
-                    await _do_clear_status_message(bot, user_id, task.thread_id or 0)
+                else:
+                    task, skip_count = await _coalesce_status_tasks(queue, task, lock)
+                    for _ in range(skip_count):
+                        queue.task_done()
+                    if task.task_type == "status_update":
+                        await _process_status_update_task(bot, user_id, task)
+                    elif task.task_type == "status_clear":
+                        await _do_clear_status_message(
+                            bot, user_id, task.thread_id or 0
+                        )
             except RetryAfter as e:
                 retry_secs = (
                     e.retry_after
@@ -507,6 +554,24 @@ async def _process_status_update_task(
         await _do_send_status_message(bot, user_id, tid, wid, status_text)
 
 
+async def _delete_message_quietly(bot: Bot, chat_id: int, message_id: int) -> None:
+    """Delete a message, ignoring failures (already gone, too old, etc.)."""
+    try:
+        await bot.delete_message(chat_id=chat_id, message_id=message_id)
+    except Exception:
+        pass
+
+
+async def _send_typing_action(bot: Bot, chat_id: int) -> None:
+    """Send the typing indicator; only flood control is propagated."""
+    try:
+        await bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
+    except RetryAfter:
+        raise
+    except Exception:
+        pass
+
+
 async def _do_send_status_message(
     bot: Bot,
     user_id: int,
@@ -520,20 +585,17 @@ async def _do_send_status_message(
     chat_id = session_manager.resolve_chat_id(user_id, thread_id)
     # Safety net: delete any orphaned status message before sending a new one.
     # This catches edge cases where tracking was cleared without deleting the message.
+    # The delete and the typing indicator are independent requests, so they are
+    # issued concurrently; the status message itself is still sent afterwards.
+    pending: list[Coroutine[Any, Any, None]] = []
     old = _status_msg_info.pop(skey, None)
     if old:
-        try:
-            await bot.delete_message(chat_id=chat_id, message_id=old[0])
-        except Exception:
-            pass
+        pending.append(_delete_message_quietly(bot, chat_id, old[0]))
     # Send typing indicator when Claude is working
     if "esc to interrupt" in text.lower():
-        try:
-            await bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
-        except RetryAfter:
-            raise
-        except Exception:
-            pass
+        pending.append(_send_typing_action(bot, chat_id))
+    if pending:
+        await asyncio.gather(*pending)
     sent = await send_with_fallback(
         bot,
         chat_id,
@@ -147,11 +147,15 @@ async def status_poll_loop(bot: Bot) -> None:
                             e,
                         )
 
-            for user_id, thread_id, wid in list(session_manager.iter_thread_bindings()):
+            # One tmux query per tick instead of one per bound window. Snapshot
+            # bindings first: a window bound while tmux is being queried must
+            # not look stale against an older binding copy.
+            bindings = list(session_manager.iter_thread_bindings())
+            live_window_ids = await tmux_manager.list_window_ids()
+            for user_id, thread_id, wid in bindings:
                 try:
                     # Clean up stale bindings (window no longer exists)
-                    w = await tmux_manager.find_window_by_id(wid)
-                    if not w:
+                    if wid not in live_window_ids:
                         session_manager.unbind_thread(user_id, thread_id)
                         await clear_topic_state(user_id, thread_id, bot)
                         logger.info(
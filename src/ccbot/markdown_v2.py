@@ -8,6 +8,7 @@ separately, so the library doesn't mangle them.
 Key function: convert_markdown(text) → MarkdownV2 string.
 """
 
+import functools
 import re
 
 import mistletoe
@@ -88,12 +89,17 @@ def _markdownify(text: str) -> str:
         return renderer.render(document)
 
 
+@functools.lru_cache(maxsize=512)
 def convert_markdown(text: str) -> str:
     """Convert standard Markdown to Telegram MarkdownV2 format.
 
     Expandable blockquote sections (marked by sentinel tokens from
     TranscriptParser) are extracted, escaped, and formatted separately
     so that telegramify_markdown doesn't mangle the >...|| syntax.
+
+    Results are memoized for repeated short strings — status lines, menu
+    texts and error replies — which are re-sent verbatim; unique assistant
+    messages simply pass through the cache.
     """
     # Extract expandable quote blocks before telegramify
     segments: list[tuple[bool, str]] = []  # (is_quote, content)
@@ -9,20 +9,26 @@ since it runs as a standalone CLI command. Config values are read from env vars.
 
 import argparse
 import os
-import subprocess
 import sys
 import time
+from itertools import count
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import libtmux
+from .utils import exec_tmux, list_tmux_windows
+
+if TYPE_CHECKING:
+    import libtmux
 
 # Mirror config.py defaults without importing it
 _SESSION_NAME = os.getenv("TMUX_SESSION_NAME", "ccbot")
 _CLAUDE_COMMAND = os.getenv("CLAUDE_COMMAND", "claude")
 _MAIN_WINDOW_NAME = "__main__"
+_TMUX_WIDTH = int(os.getenv("CCBOT_TMUX_WIDTH", "200"))
+_TMUX_HEIGHT = int(os.getenv("CCBOT_TMUX_HEIGHT", "50"))
 
 
-def _get_or_create_session(server: libtmux.Server) -> libtmux.Session:
+def _get_or_create_session(server: "libtmux.Server") -> "libtmux.Session":
     """Get existing ccbot session or create a new one."""
     session = server.sessions.get(session_name=_SESSION_NAME)
     if session:
@@ -31,22 +37,23 @@ def _get_or_create_session(server: libtmux.Server) -> libtmux.Session:
     session = server.new_session(
         session_name=_SESSION_NAME,
         start_directory=str(Path.home()),
+        x=_TMUX_WIDTH,
+        y=_TMUX_HEIGHT,
     )
     if session.windows:
         session.windows[0].rename_window(_MAIN_WINDOW_NAME)
     return session
 
 
-def _deduplicate_name(session: libtmux.Session, name: str) -> str:
+def _deduplicate_name(name: str, existing: set[str]) -> str:
     """Append -2, -3, etc. if a window with this name already exists."""
-    existing = {w.window_name for w in session.windows}
     if name not in existing:
         return name
-    base = name
-    counter = 2
-    while f"{base}-{counter}" in existing:
-        counter += 1
-    return f"{base}-{counter}"
+    return next(
+        candidate
+        for candidate in (f"{name}-{i}" for i in count(2))
+        if candidate not in existing
+    )
 
 
 def new_session_main() -> None:
@@ -83,11 +90,15 @@ def new_session_main() -> None:
         print(f"Error: not a directory: {path}", file=sys.stderr)
         sys.exit(1)
 
+    # Imported after validation so --help and bad paths don't pay for libtmux
+    import libtmux
+
     server = libtmux.Server()
     session = _get_or_create_session(server)
 
     window_name = args.name if args.name else path.name
-    window_name = _deduplicate_name(session, window_name)
+    existing = {name for _, name in list_tmux_windows(_SESSION_NAME) or []}
+    window_name = _deduplicate_name(window_name, existing)
 
     window = session.new_window(
         window_name=window_name,
@@ -107,14 +118,22 @@ def new_session_main() -> None:
     target = f"{_SESSION_NAME}:{window_id}"
     if os.environ.get("TMUX"):
         # Already inside tmux — switch to the new window
-        os.execvp("tmux", ["tmux", "switch-client", "-t", target])
+        exec_tmux(["switch-client", "-t", target])
     else:
         # Outside tmux — create a grouped session (independent current-window)
         # and select the chosen window. Session auto-destroys on detach.
         suffix = f"{window_id.lstrip('@')}-{int(time.time()) % 10000}"
         session_name = f"{_SESSION_NAME}-{suffix}"
-        os.execvp("tmux", [
-            "tmux", "new-session", "-t", _SESSION_NAME,
-            "-s", session_name,
-            ";", "select-window", "-t", window_id,
-        ])
+        exec_tmux(
+            [
+                "new-session",
+                "-t",
+                _SESSION_NAME,
+                "-s",
+                session_name,
+                ";",
+                "select-window",
+                "-t",
+                window_id,
+            ]
+        )
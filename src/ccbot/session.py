@@ -8,7 +8,8 @@ Responsibilities:
   - Persist/load state to ~/.ccbot/state.json.
   - Sync window↔session bindings from session_map.json (written by hook).
   - Resolve window IDs to ClaudeSession objects (JSONL file reading).
-  - Track per-user read offsets for unread-message detection.
+  - Track per-user read offsets for unread-message detection (saved lazily
+    via save_if_dirty, since they change on every delivered message).
   - Manage thread↔window bindings for Telegram topic routing.
   - Send keystrokes to tmux windows and retrieve message history.
   - Maintain window_id→display name mapping for UI display.
@@ -18,6 +19,7 @@ Key class: SessionManager (singleton instantiated as `session_manager`).
 Key methods for thread binding access:
   - resolve_window_for_thread: Get window_id for a user's thread
   - iter_thread_bindings: Generator for iterating all (user_id, thread_id, window_id)
+  - get_window_ids_for_session: Window IDs currently holding a session_id
   - find_users_for_session: Find all users bound to a session_id
 """
 
@@ -109,6 +111,8 @@ class SessionManager:
     # History: originally added in 5afc111, erroneously removed in 26cb81f,
     # restored in PR #23.
     group_chat_ids: dict[str, int] = field(default_factory=dict)
+    # Unsaved changes that don't need an immediate write (read offsets)
+    _dirty: bool = field(default=False, repr=False)
 
     def __post_init__(self) -> None:
         self._load_state()
@@ -127,8 +131,14 @@ class SessionManager:
             "group_chat_ids": self.group_chat_ids,
         }
         atomic_write_json(config.state_file, state)
+        self._dirty = False
         logger.debug("State saved to %s", config.state_file)
 
+    def save_if_dirty(self) -> None:
+        """Save state only if a deferred change is pending."""
+        if self._dirty:
+            self._save_state()
+
     def _is_window_id(self, key: str) -> bool:
         """Check if a key looks like a tmux window ID (e.g. '@0', '@12')."""
         return key.startswith("@") and len(key) > 1 and key[1:].isdigit()
@@ -571,21 +581,38 @@ class SessionManager:
         encoded_cwd = cwd.replace("/", "-")
         return config.claude_projects_path / encoded_cwd / f"{session_id}.jsonl"
 
-    async def _get_session_direct(
-        self, session_id: str, cwd: str
-    ) -> ClaudeSession | None:
-        """Get a ClaudeSession directly from session_id and cwd (no scanning)."""
+    def _find_session_file(self, session_id: str, cwd: str) -> Path | None:
+        """Locate a session's JSONL file from session_id and cwd (no reading)."""
         file_path = self._build_session_file_path(session_id, cwd)
 
         # Fallback: glob search if direct path doesn't exist
         if not file_path or not file_path.exists():
             pattern = f"*/{session_id}.jsonl"
             matches = list(config.claude_projects_path.glob(pattern))
-            if matches:
-                file_path = matches[0]
-                logger.debug("Found session via glob: %s", file_path)
-            else:
+            if not matches:
                 return None
+            file_path = matches[0]
+            logger.debug("Found session via glob: %s", file_path)
+        return file_path
+
+    def get_session_file(self, window_id: str) -> Path | None:
+        """Return the JSONL file of the window's session without parsing it.
+
+        Cheap alternative to resolve_session_for_window when only the path
+        (e.g. its size for read offsets) is needed.
+        """
+        state = self.window_states.get(window_id)
+        if not state or not state.session_id or not state.cwd:
+            return None
+        return self._find_session_file(state.session_id, state.cwd)
+
+    async def _get_session_direct(
+        self, session_id: str, cwd: str
+    ) -> ClaudeSession | None:
+        """Get a ClaudeSession directly from session_id and cwd (no scanning)."""
+        file_path = self._find_session_file(session_id, cwd)
+        if not file_path:
+            return None
 
         # Single pass: read file once, extract summary + count messages
         summary = ""
@@ -659,11 +686,16 @@ class SessionManager:
     def update_user_window_offset(
         self, user_id: int, window_id: str, offset: int
     ) -> None:
-        """Update the user's last read offset for a window."""
+        """Update the user's last read offset for a window.
+
+        Called for every delivered message, so the write is deferred to the
+        next save_if_dirty() (monitor loop / shutdown) instead of an fsync'd
+        rewrite of the whole state file each time.
+        """
         if user_id not in self.user_window_offsets:
             self.user_window_offsets[user_id] = {}
         self.user_window_offsets[user_id][window_id] = offset
-        self._save_state()
+        self._dirty = True
 
     # --- Thread binding management ---
 
@@ -740,6 +772,19 @@ class SessionManager:
             for thread_id, window_id in bindings.items():
                 yield user_id, thread_id, window_id
 
+    def get_window_ids_for_session(self, session_id: str) -> set[str]:
+        """Return the window_ids whose persisted state holds the given session_id.
+
+        Computed once per lookup so callers can test bindings with a set
+        membership check instead of resolving (and re-reading the JSONL of)
+        every bound window.
+        """
+        return {
+            wid
+            for wid, ws in self.window_states.items()
+            if ws.session_id == session_id and ws.cwd
+        }
+
     async def find_users_for_session(
         self,
         session_id: str,
@@ -748,12 +793,12 @@ class SessionManager:
 
         Returns list of (user_id, window_id, thread_id) tuples.
         """
-        result: list[tuple[int, str, int]] = []
-        for user_id, thread_id, window_id in self.iter_thread_bindings():
-            resolved = await self.resolve_session_for_window(window_id)
-            if resolved and resolved.session_id == session_id:
-                result.append((user_id, window_id, thread_id))
-        return result
+        window_ids = self.get_window_ids_for_session(session_id)
+        return [
+            (user_id, window_id, thread_id)
+            for user_id, thread_id, window_id in self.iter_thread_bindings()
+            if window_id in window_ids
+        ]
 
     # --- Tmux helpers ---
 
@@ -785,43 +830,44 @@ class SessionManager:
     ) -> tuple[list[dict], int]:
         """Get user/assistant messages for a window's session.
 
-        Resolves window → session, then reads the JSONL.
+        Resolves window → session file, then reads the JSONL.
         Supports byte range filtering via start_byte/end_byte.
         Returns (messages, total_count).
         """
-        session = await self.resolve_session_for_window(window_id)
-        if not session or not session.file_path:
+        # Only the path is needed: resolve_session_for_window would read the
+        # whole transcript for its summary/count on every history page.
+        file_path = self.get_session_file(window_id)
+        if file_path is None:
+            # Let resolve_session_for_window clear a stale session binding
+            await self.resolve_session_for_window(window_id)
             return [], 0
 
-        file_path = Path(session.file_path)
-        if not file_path.exists():
-            return [], 0
-
-        # Read JSONL entries (optionally filtered by byte range)
-        entries: list[dict] = []
+        # Read the byte range in one go rather than a tell()+readline() pair
+        # (each a thread hop in aiofiles) per line. A line that starts before
+        # end_byte is read to its end, as before.
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
+            async with aiofiles.open(file_path, "rb") as f:
                 if start_byte > 0:
                     await f.seek(start_byte)
-
-                while True:
-                    # Check byte limit before reading
-                    if end_byte is not None:
-                        current_pos = await f.tell()
-                        if current_pos >= end_byte:
-                            break
-
-                    line = await f.readline()
-                    if not line:
-                        break
-
-                    data = TranscriptParser.parse_line(line)
-                    if data:
-                        entries.append(data)
+                if end_byte is None:
+                    raw = await f.read()
+                else:
+                    raw = await f.read(max(0, end_byte - start_byte))
+                    if raw and not raw.endswith(b"\n"):
+                        raw += await f.readline()
         except OSError as e:
             logger.error("Error reading session file %s: %s", file_path, e)
             return [], 0
 
+        # Split on b"\n" only: JSON strings may contain U+2028 etc. unescaped
+        entries: list[dict] = []
+        for line in raw.split(b"\n"):
+            if not TranscriptParser.may_be_message(line):
+                continue
+            data = TranscriptParser.parse_line(line)
+            if data:
+                entries.append(data)
+
         parsed_entries, _ = TranscriptParser.parse_entries(entries)
         all_messages = [
             {
@@ -6,7 +6,9 @@ Runs an async polling loop that:
   3. Reads new JSONL lines from each session file using byte-offset tracking.
   4. Parses entries via TranscriptParser and emits NewMessage objects to a callback.
 
-Optimizations: mtime cache skips unchanged files; byte offset avoids re-reading.
+Optimizations: mtime cache skips unchanged files; byte offset avoids re-reading;
+the full project scan only runs when an active session's file is not yet known
+(or every FULL_SCAN_INTERVAL seconds) — other cycles just stat known files.
 
 Key classes: SessionMonitor, NewMessage, SessionInfo.
 """
@@ -14,6 +16,8 @@ Key classes: SessionMonitor, NewMessage, SessionInfo.
 import asyncio
 import json
 import logging
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Awaitable
@@ -28,6 +32,16 @@ from .utils import read_cwd_from_jsonl
 
 logger = logging.getLogger(__name__)
 
+# Max seconds between full project scans while all active sessions are known
+FULL_SCAN_INTERVAL = 10.0
+
+# Poll interval growth per idle cycle (capped at config.monitor_max_poll_interval)
+POLL_BACKOFF_FACTOR = 1.5
+
+# Shared default for sessions with no pending tool_use; parse_entries never
+# mutates the dict it is given, so one instance serves every miss
+_NO_PENDING_TOOLS: dict[str, Any] = {}
+
 
 @dataclass
 class SessionInfo:
@@ -63,6 +77,7 @@ class SessionMonitor:
         projects_path: Path | None = None,
         poll_interval: float | None = None,
         state_file: Path | None = None,
+        max_poll_interval: float | None = None,
     ):
         self.projects_path = (
             projects_path if projects_path is not None else config.claude_projects_path
@@ -70,6 +85,12 @@ class SessionMonitor:
         self.poll_interval = (
             poll_interval if poll_interval is not None else config.monitor_poll_interval
         )
+        self.max_poll_interval = max(
+            self.poll_interval,
+            max_poll_interval
+            if max_poll_interval is not None
+            else config.monitor_max_poll_interval,
+        )
 
         self.state = MonitorState(state_file=state_file or config.monitor_state_file)
         self.state.load()
@@ -77,6 +98,8 @@ class SessionMonitor:
         self._running = False
         self._task: asyncio.Task | None = None
         self._message_callback: Callable[[NewMessage], Awaitable[None]] | None = None
+        # Set to cut an idle backoff sleep short (e.g. user just sent input)
+        self._wake_event = asyncio.Event()
         # Per-session pending tool_use state carried across poll cycles
         self._pending_tools: dict[str, dict[str, Any]] = {}  # session_id -> pending
         # Track last known session_map for detecting changes
@@ -84,12 +107,40 @@ class SessionMonitor:
         self._last_session_map: dict[str, str] = {}  # window_key -> session_id
         # In-memory mtime cache for quick file change detection (not persisted)
         self._file_mtimes: dict[str, float] = {}  # session_id -> last_seen_mtime
+        # Session files found by the last full scan, reused between scans
+        self._known_sessions: dict[str, SessionInfo] = {}  # session_id -> info
+        self._last_full_scan = 0.0  # monotonic time of last scan_projects()
+        # Parsed sessions-index.json files, keyed by (st_mtime_ns, st_size)
+        self._index_cache: dict[Path, tuple[tuple[int, int], list[dict], str]] = {}
 
     def set_message_callback(
         self, callback: Callable[[NewMessage], Awaitable[None]]
     ) -> None:
         self._message_callback = callback
 
+    def wake(self) -> None:
+        """Poll again now and drop back to the base interval.
+
+        Called when input is forwarded to a window, so a reply after a long
+        idle period isn't delayed by the backed-off interval.
+        """
+        self._wake_event.set()
+
+    def _next_interval(self, current: float, had_messages: bool) -> float:
+        """Reset to poll_interval on activity, otherwise back off to the cap."""
+        if had_messages:
+            return self.poll_interval
+        return min(current * POLL_BACKOFF_FACTOR, self.max_poll_interval)
+
+    async def _sleep(self, interval: float) -> bool:
+        """Sleep for interval seconds; returns True if woken early."""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=interval)
+        except TimeoutError:
+            return False
+        self._wake_event.clear()
+        return True
+
     async def _get_active_cwds(self) -> set[str]:
         """Get normalized cwds of all active tmux windows."""
         cwds = set()
@@ -101,6 +152,27 @@ class SessionMonitor:
                 cwds.add(w.cwd)
         return cwds
 
+    async def _load_index(self, index_file: Path) -> tuple[list[dict], str]:
+        """Return (entries, originalPath) of a sessions-index.json file.
+
+        The parse is cached until the file's mtime or size changes, so idle
+        projects cost a stat() per scan instead of a read and a JSON parse.
+        Raises OSError / json.JSONDecodeError like a plain read would.
+        """
+        st = index_file.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._index_cache.get(index_file)
+        if cached and cached[0] == key:
+            return cached[1], cached[2]
+
+        async with aiofiles.open(index_file, "r") as f:
+            content = await f.read()
+        index_data = json.loads(content)
+        entries = index_data.get("entries", [])
+        original_path = index_data.get("originalPath", "")
+        self._index_cache[index_file] = (key, entries, original_path)
+        return entries, original_path
+
     async def scan_projects(self) -> list[SessionInfo]:
         """Scan projects that have active tmux windows."""
         active_cwds = await self._get_active_cwds()
@@ -109,52 +181,53 @@ class SessionMonitor:
 
         sessions = []
 
-        if not self.projects_path.exists():
+        # scandir's DirEntry.is_dir() reuses the type from the directory read
+        # instead of a stat() per project
+        try:
+            with os.scandir(self.projects_path) as it:
+                project_dirs = [Path(e.path) for e in it if e.is_dir()]
+        except OSError:
             return sessions
 
-        for project_dir in self.projects_path.iterdir():
-            if not project_dir.is_dir():
-                continue
-
+        for project_dir in project_dirs:
             index_file = project_dir / "sessions-index.json"
             original_path = ""
             indexed_ids: set[str] = set()
 
-            if index_file.exists():
+            # _load_index stats the file anyway: a missing index is just
+            # FileNotFoundError rather than a separate exists() check
+            entries: list[dict] = []
+            try:
+                entries, original_path = await self._load_index(index_file)
+            except FileNotFoundError:
+                pass
+            except (json.JSONDecodeError, OSError) as e:
+                logger.debug(f"Error reading index {index_file}: {e}")
+
+            for entry in entries:
+                session_id = entry.get("sessionId", "")
+                full_path = entry.get("fullPath", "")
+                project_path = entry.get("projectPath", original_path)
+
+                if not session_id or not full_path:
+                    continue
+
                 try:
-                    async with aiofiles.open(index_file, "r") as f:
-                        content = await f.read()
-                    index_data = json.loads(content)
-                    entries = index_data.get("entries", [])
-                    original_path = index_data.get("originalPath", "")
-
-                    for entry in entries:
-                        session_id = entry.get("sessionId", "")
-                        full_path = entry.get("fullPath", "")
-                        project_path = entry.get("projectPath", original_path)
-
-                        if not session_id or not full_path:
-                            continue
-
-                        try:
-                            norm_pp = str(Path(project_path).resolve())
-                        except (OSError, ValueError):
-                            norm_pp = project_path
-                        if norm_pp not in active_cwds:
-                            continue
-
-                        indexed_ids.add(session_id)
-                        file_path = Path(full_path)
-                        if file_path.exists():
-                            sessions.append(
-                                SessionInfo(
-                                    session_id=session_id,
-                                    file_path=file_path,
-                                )
-                            )
-
-                except (json.JSONDecodeError, OSError) as e:
-                    logger.debug(f"Error reading index {index_file}: {e}")
+                    norm_pp = str(Path(project_path).resolve())
+                except (OSError, ValueError):
+                    norm_pp = project_path
+                if norm_pp not in active_cwds:
+                    continue
+
+                indexed_ids.add(session_id)
+                file_path = Path(full_path)
+                if file_path.exists():
+                    sessions.append(
+                        SessionInfo(
+                            session_id=session_id,
+                            file_path=file_path,
+                        )
+                    )
 
             # Pick up un-indexed .jsonl files
             try:
@@ -193,20 +266,53 @@ class SessionMonitor:
 
         return sessions
 
+    async def _get_session_files(
+        self, active_session_ids: set[str]
+    ) -> list[SessionInfo]:
+        """Return session files to check, rescanning projects only when needed.
+
+        scan_projects() lists every project dir, parses index files and asks
+        tmux for window cwds. Re-use its last result while every active
+        session is already known; rescan when one is missing (new window or
+        /clear) and at least every FULL_SCAN_INTERVAL seconds.
+        """
+        now = time.monotonic()
+        if (
+            now - self._last_full_scan < FULL_SCAN_INTERVAL
+            and active_session_ids <= self._known_sessions.keys()
+        ):
+            return list(self._known_sessions.values())
+
+        sessions = await self.scan_projects()
+        self._known_sessions = {s.session_id: s for s in sessions}
+        self._last_full_scan = now
+        return sessions
+
     async def _read_new_lines(
-        self, session: TrackedSession, file_path: Path
+        self,
+        session: TrackedSession,
+        file_path: Path,
+        file_size: int | None = None,
     ) -> list[dict]:
         """Read new lines from a session file using byte offset for efficiency.
 
+        The delta since the last offset is read in one call and split in
+        memory, rather than one readline()/tell() (each a thread hop in
+        aiofiles) per line. Pass ``file_size`` when the caller has just
+        stat'ed the file to skip measuring it again.
+
         Detects file truncation (e.g. after /clear) and resets offset.
         Recovers from corrupted offsets (mid-line) by scanning to next line.
+        The offset is advanced past the returned entries even if reading
+        fails part-way, so a partial batch isn't re-emitted next cycle.
         """
         new_entries = []
+        safe_offset: int | None = None
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                # Get file size to detect truncation
-                await f.seek(0, 2)  # Seek to end
-                file_size = await f.tell()
+            async with aiofiles.open(file_path, "rb") as f:
+                if file_size is None:
+                    # Get file size to detect truncation
+                    file_size = await f.seek(0, 2)  # Seek to end
 
                 # Detect file truncation: if offset is beyond file size, reset
                 if session.last_byte_offset > file_size:
@@ -219,51 +325,64 @@ class SessionMonitor:
                     )
                     session.last_byte_offset = 0
 
-                # Seek to last read position for incremental reading
+                # Read everything from the last position for incremental reading
                 await f.seek(session.last_byte_offset)
-
-                # Detect corrupted offset: if we're mid-line (not at '{'),
-                # scan forward to the next line start. This can happen if
-                # the state file was manually edited or corrupted.
-                if session.last_byte_offset > 0:
-                    first_char = await f.read(1)
-                    if first_char and first_char != "{":
-                        logger.warning(
-                            "Corrupted offset %d in session %s (mid-line), "
-                            "scanning to next line",
-                            session.last_byte_offset,
-                            session.session_id,
-                        )
-                        await f.readline()  # Skip rest of partial line
-                        session.last_byte_offset = await f.tell()
-                        return []
-                    await f.seek(session.last_byte_offset)  # Reset for normal read
-
-                # Read only new lines from the offset.
-                # Track safe_offset: only advance past lines that parsed
-                # successfully. A non-empty line that fails JSON parsing is
-                # likely a partial write; stop and retry next cycle.
-                safe_offset = session.last_byte_offset
-                async for line in f:
-                    data = TranscriptParser.parse_line(line)
-                    if data:
-                        new_entries.append(data)
-                        safe_offset = await f.tell()
-                    elif line.strip():
-                        # Partial JSONL line — don't advance offset past it
-                        logger.warning(
-                            "Partial JSONL line in session %s, will retry next cycle",
-                            session.session_id,
-                        )
-                        break
-                    else:
-                        # Empty line — safe to skip
-                        safe_offset = await f.tell()
-
-                session.last_byte_offset = safe_offset
+                buf = await f.read()
+
+            base = session.last_byte_offset
+
+            # Detect corrupted offset: if we're mid-line (not at '{'),
+            # scan forward to the next line start. This can happen if
+            # the state file was manually edited or corrupted.
+            if base > 0 and buf and buf[:1] != b"{":
+                logger.warning(
+                    "Corrupted offset %d in session %s (mid-line), "
+                    "scanning to next line",
+                    base,
+                    session.session_id,
+                )
+                newline = buf.find(b"\n")
+                skip = len(buf) if newline == -1 else newline + 1
+                session.last_byte_offset = base + skip
+                return []
+
+            # Track safe_offset: only advance past lines that parsed
+            # successfully. A non-empty line that fails JSON parsing is
+            # likely a partial write; stop and retry next cycle.
+            safe_offset = base
+            start = 0
+            while start < len(buf):
+                newline = buf.find(b"\n", start)
+                complete = newline != -1
+                end = newline + 1 if complete else len(buf)
+                line = buf[start:end]
+                start = end
+                # Complete lines that can't be messages need no parse.
+                # An unterminated line may still be mid-write, so it
+                # always goes through the partial-line check below.
+                if complete and not TranscriptParser.may_be_message(line):
+                    safe_offset = base + end
+                    continue
+                data = TranscriptParser.parse_line(line)
+                if data:
+                    new_entries.append(data)
+                    safe_offset = base + end
+                elif line.strip():
+                    # Partial JSONL line — don't advance offset past it
+                    logger.warning(
+                        "Partial JSONL line in session %s, will retry next cycle",
+                        session.session_id,
+                    )
+                    break
+                else:
+                    # Empty line — safe to skip
+                    safe_offset = base + end
 
         except OSError as e:
             logger.error("Error reading session file %s: %s", file_path, e)
+        finally:
+            if safe_offset is not None:
+                session.last_byte_offset = safe_offset
         return new_entries
 
     async def check_for_updates(self, active_session_ids: set[str]) -> list[NewMessage]:
@@ -277,8 +396,7 @@ class SessionMonitor:
         """
         new_messages = []
 
-        # Scan projects to get available session files
-        sessions = await self.scan_projects()
+        sessions = await self._get_session_files(active_session_ids)
 
         # Only process sessions that are in session_map
         for session_info in sessions:
@@ -315,16 +433,17 @@ class SessionMonitor:
                     continue
 
                 last_mtime = self._file_mtimes.get(session_info.session_id, 0.0)
-                if (
+                if current_size == tracked.last_byte_offset or (
                     current_mtime <= last_mtime
-                    and current_size <= tracked.last_byte_offset
+                    and current_size < tracked.last_byte_offset
                 ):
-                    # File hasn't changed, skip reading
+                    # No new bytes (mtime alone can move without a write on
+                    # some filesystems), skip opening the file
                     continue
 
                 # File changed, read new content from last offset
                 new_entries = await self._read_new_lines(
-                    tracked, session_info.file_path
+                    tracked, session_info.file_path, file_size=current_size
                 )
                 self._file_mtimes[session_info.session_id] = current_mtime
 
@@ -335,7 +454,9 @@ class SessionMonitor:
                     )
 
                 # Parse new entries using the shared logic, carrying over pending tools
-                carry = self._pending_tools.get(session_info.session_id, {})
+                carry = self._pending_tools.get(
+                    session_info.session_id, _NO_PENDING_TOOLS
+                )
                 parsed_entries, remaining = TranscriptParser.parse_entries(
                     new_entries,
                     pending_tools=carry,
@@ -466,12 +587,44 @@ class SessionMonitor:
 
         return current_map
 
+    async def _dispatch_messages(self, messages: list[NewMessage]) -> None:
+        """Hand a cycle's messages to the callback.
+
+        Order matters within a session (it is the order of the transcript),
+        but sessions are independent — deliver each session's messages in
+        sequence while different sessions proceed concurrently.
+        """
+        by_session: dict[str, list[NewMessage]] = {}
+        for msg in messages:
+            by_session.setdefault(msg.session_id, []).append(msg)
+        await asyncio.gather(
+            *(self._deliver_in_order(batch) for batch in by_session.values())
+        )
+
+    async def _deliver_in_order(self, messages: list[NewMessage]) -> None:
+        """Deliver one session's messages sequentially."""
+        for msg in messages:
+            status = "complete" if msg.is_complete else "streaming"
+            preview = msg.text[:80] + ("..." if len(msg.text) > 80 else "")
+            logger.info("[%s] session=%s: %s", status, msg.session_id, preview)
+            if self._message_callback:
+                try:
+                    await self._message_callback(msg)
+                except Exception as e:
+                    logger.error(f"Message callback error: {e}")
+
     async def _monitor_loop(self) -> None:
         """Background loop for checking session updates.
 
-        Uses simple async polling with aiofiles for non-blocking I/O.
+        Uses simple async polling with aiofiles for non-blocking I/O. The
+        interval backs off while no new messages arrive and resets as soon
+        as one does (or on wake()).
         """
-        logger.info("Session monitor started, polling every %ss", self.poll_interval)
+        logger.info(
+            "Session monitor started, polling every %ss (idle max %ss)",
+            self.poll_interval,
+            self.max_poll_interval,
+        )
 
         # Deferred import to avoid circular dependency (cached once)
         from .session import session_manager
@@ -481,7 +634,9 @@ class SessionMonitor:
         # Initialize last known session_map
         self._last_session_map = await self._load_current_session_map()
 
+        interval = self.poll_interval
         while self._running:
+            new_messages: list[NewMessage] = []
             try:
                 # Load hook-based session map updates
                 await session_manager.load_session_map()
@@ -492,21 +647,20 @@ class SessionMonitor:
 
                 # Check for new messages (all I/O is async)
                 new_messages = await self.check_for_updates(active_session_ids)
-
-                for msg in new_messages:
-                    status = "complete" if msg.is_complete else "streaming"
-                    preview = msg.text[:80] + ("..." if len(msg.text) > 80 else "")
-                    logger.info("[%s] session=%s: %s", status, msg.session_id, preview)
-                    if self._message_callback:
-                        try:
-                            await self._message_callback(msg)
-                        except Exception as e:
-                            logger.error(f"Message callback error: {e}")
+                await self._dispatch_messages(new_messages)
 
             except Exception as e:
                 logger.error(f"Monitor loop error: {e}")
 
-            await asyncio.sleep(self.poll_interval)
+            # Flush read offsets deferred by update_user_window_offset
+            try:
+                session_manager.save_if_dirty()
+            except OSError as e:
+                logger.error("Failed to save session state: %s", e)
+
+            interval = self._next_interval(interval, bool(new_messages))
+            if await self._sleep(interval):
+                interval = self.poll_interval
 
         logger.info("Session monitor stopped")
 
@@ -3,8 +3,12 @@
 Provides:
   - split_message(): splits long text into Telegram-safe chunks (≤4096 chars),
     preferring newline boundaries.
+  - split_paragraphs(): same chunking for blank-line separated paragraphs,
+    without first joining them into one string.
 """
 
+from collections.abc import Iterable, Iterator
+
 TELEGRAM_MAX_MESSAGE_LENGTH = 4096
 
 
@@ -18,26 +22,64 @@ def split_message(
     if len(text) <= max_length:
         return [text]
 
-    chunks = []
-    current_chunk = ""
+    return _split_lines(text.split("\n"), max_length)
+
+
+def split_paragraphs(
+    paragraphs: list[str], max_length: int = TELEGRAM_MAX_MESSAGE_LENGTH
+) -> list[str]:
+    """Split paragraphs into chunks as if they were joined by blank lines.
+
+    Equivalent to ``split_message("\\n\\n".join(paragraphs), max_length)``, but
+    the joined text is only built when it fits in a single chunk.
+    """
+    total = sum(map(len, paragraphs)) + 2 * max(len(paragraphs) - 1, 0)
+    if total <= max_length:
+        return ["\n\n".join(paragraphs)]
+
+    return _split_lines(_paragraph_lines(paragraphs), max_length)
+
+
+def _paragraph_lines(paragraphs: list[str]) -> Iterator[str]:
+    """Yield the lines of paragraphs with an empty line between each pair."""
+    for i, paragraph in enumerate(paragraphs):
+        if i:
+            yield ""
+        yield from paragraph.split("\n")
+
+
+def _split_lines(lines: Iterable[str], max_length: int) -> list[str]:
+    """Group lines into chunks of at most max_length chars.
+
+    Lines are collected in a list with a running length and joined once per
+    chunk, instead of growing the chunk string line by line.
+    """
+    chunks: list[str] = []
+    current_lines: list[str] = []
+    current_len = 0  # length of the chunk including a trailing newline per line
+
+    def flush() -> None:
+        chunks.append("\n".join(current_lines).rstrip("\n"))
+        current_lines.clear()
 
-    for line in text.split("\n"):
+    for line in lines:
         # If single line exceeds max, split it forcefully
         if len(line) > max_length:
-            if current_chunk:
-                chunks.append(current_chunk.rstrip("\n"))
-                current_chunk = ""
+            if current_lines:
+                flush()
+                current_len = 0
             # Split long line into fixed-size pieces
             for i in range(0, len(line), max_length):
                 chunks.append(line[i : i + max_length])
-        elif len(current_chunk) + len(line) + 1 > max_length:
+            continue
+        if current_lines and current_len + len(line) + 1 > max_length:
             # Current chunk is full, start a new one
-            chunks.append(current_chunk.rstrip("\n"))
-            current_chunk = line + "\n"
-        else:
-            current_chunk += line + "\n"
+            flush()
+            current_len = 0
+        current_lines.append(line)
+        current_len += len(line) + 1
 
-    if current_chunk:
-        chunks.append(current_chunk.rstrip("\n"))
+    if current_lines:
+        flush()
 
     return chunks
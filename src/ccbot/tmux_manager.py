@@ -71,12 +71,31 @@ class TmuxManager:
         session = self.server.new_session(
             session_name=self.session_name,
             start_directory=str(Path.home()),
+            x=config.tmux_window_width,
+            y=config.tmux_window_height,
         )
         # Rename the default window to the main window name
         if session.windows:
             session.windows[0].rename_window(config.tmux_main_window_name)
         return session
 
+    @staticmethod
+    def _window_info(window: libtmux.Window) -> TmuxWindow:
+        """Build a TmuxWindow from a libtmux window (reads its active pane)."""
+        pane = window.active_pane
+        if pane:
+            cwd = pane.pane_current_path or ""
+            pane_cmd = pane.pane_current_command or ""
+        else:
+            cwd = ""
+            pane_cmd = ""
+        return TmuxWindow(
+            window_id=window.window_id or "",
+            window_name=window.window_name or "",
+            cwd=cwd,
+            pane_current_command=pane_cmd,
+        )
+
     async def list_windows(self) -> list[TmuxWindow]:
         """List all windows in the session with their working directories.
 
@@ -92,29 +111,12 @@ class TmuxManager:
                 return windows
 
             for window in session.windows:
-                name = window.window_name or ""
                 # Skip the main window (placeholder window)
-                if name == config.tmux_main_window_name:
+                if window.window_name == config.tmux_main_window_name:
                     continue
 
                 try:
-                    # Get the active pane's current path and command
-                    pane = window.active_pane
-                    if pane:
-                        cwd = pane.pane_current_path or ""
-                        pane_cmd = pane.pane_current_command or ""
-                    else:
-                        cwd = ""
-                        pane_cmd = ""
-
-                    windows.append(
-                        TmuxWindow(
-                            window_id=window.window_id or "",
-                            window_name=name,
-                            cwd=cwd,
-                            pane_current_command=pane_cmd,
-                        )
-                    )
+                    windows.append(self._window_info(window))
                 except Exception as e:
                     logger.debug(f"Error getting window info: {e}")
 
@@ -122,6 +124,26 @@ class TmuxManager:
 
         return await asyncio.to_thread(_sync_list_windows)
 
+    async def list_window_ids(self) -> set[str]:
+        """Return the IDs of all windows in the session (main window excluded).
+
+        Cheaper than list_windows() when only existence matters: a single
+        list-windows query, without per-window pane lookups.
+        """
+
+        def _sync_list_window_ids() -> set[str]:
+            session = self.get_session()
+            if not session:
+                return set()
+            return {
+                window.window_id
+                for window in session.windows
+                if window.window_id
+                and window.window_name != config.tmux_main_window_name
+            }
+
+        return await asyncio.to_thread(_sync_list_window_ids)
+
     async def find_window_by_name(self, window_name: str) -> TmuxWindow | None:
         """Find a window by its name.
 
@@ -147,12 +169,26 @@ class TmuxManager:
         Returns:
             TmuxWindow if found, None otherwise
         """
-        windows = await self.list_windows()
-        for window in windows:
-            if window.window_id == window_id:
-                return window
-        logger.debug("Window not found by id: %s", window_id)
-        return None
+
+        # Look the window up directly instead of building a TmuxWindow (and
+        # querying the active pane) for every window in the session.
+        def _sync_find() -> TmuxWindow | None:
+            session = self.get_session()
+            if not session:
+                return None
+            try:
+                window = session.windows.get(window_id=window_id, default=None)
+                if window is None or window.window_name == config.tmux_main_window_name:
+                    return None
+                return self._window_info(window)
+            except Exception as e:
+                logger.debug(f"Error getting window info: {e}")
+                return None
+
+        window = await asyncio.to_thread(_sync_find)
+        if window is None:
+            logger.debug("Window not found by id: %s", window_id)
+        return window
 
     async def capture_pane(self, window_id: str, with_ansi: bool = False) -> str | None:
         """Capture the visible text content of a window's active pane.
@@ -355,10 +391,11 @@ class TmuxManager:
         # Create window name, adding suffix if name already exists
         final_window_name = window_name if window_name else path.name
 
-        # Check for existing window name
+        # Check for existing window name (list windows once, not per candidate)
+        existing = {w.window_name for w in await self.list_windows()}
         base_name = final_window_name
         counter = 2
-        while await self.find_window_by_name(final_window_name):
+        while final_window_name in existing:
             final_window_name = f"{base_name}-{counter}"
             counter += 1
 
@@ -77,24 +77,39 @@ class TranscriptParser:
     _MAX_SUMMARY_LENGTH = 200
 
     @staticmethod
-    def parse_line(line: str) -> dict | None:
+    def parse_line(line: str | bytes) -> dict | None:
         """Parse a single JSONL line.
 
+        json.loads tolerates surrounding whitespace and accepts UTF-8 bytes,
+        so lines are passed through as-is (no strip/decode copies).
+
         Args:
-            line: A single line from the JSONL file
+            line: A single line from the JSONL file (str or raw bytes)
 
         Returns:
             Parsed dict or None if line is empty/invalid
         """
-        line = line.strip()
-        if not line:
+        if not line or line.isspace():
             return None
 
         try:
             return json.loads(line)
-        except json.JSONDecodeError:
+        except ValueError:  # JSONDecodeError, or invalid UTF-8 in bytes
             return None
 
+    @staticmethod
+    def may_be_message(line: str | bytes) -> bool:
+        """Cheap prescreen: can this raw line be a user/assistant entry?
+
+        Only those entries are ever displayed, and their "type" value must
+        appear quoted somewhere in the line regardless of JSON whitespace.
+        False positives merely cost a parse; lines like file-history-snapshot
+        or progress records can skip json.loads entirely.
+        """
+        if isinstance(line, bytes):
+            return b'"user"' in line or b'"assistant"' in line
+        return '"user"' in line or '"assistant"' in line
+
     @staticmethod
     def get_message_type(data: dict) -> str | None:
         """Get the message type from parsed data.
@@ -127,17 +142,25 @@ class TranscriptParser:
                 return content_list
             return ""
 
-        texts = []
-        for item in content_list:
+        # Fast path: most assistant entries carry a single block
+        if len(content_list) == 1:
+            item = content_list[0]
             if isinstance(item, str):
-                texts.append(item)
-            elif isinstance(item, dict):
-                if item.get("type") == "text":
-                    text = item.get("text", "")
-                    if text:
-                        texts.append(text)
+                return item
+            if isinstance(item, dict) and item.get("type") == "text":
+                return item.get("text") or ""
+            return ""
 
-        return "\n".join(texts)
+        return "\n".join(
+            item if isinstance(item, str) else item["text"]
+            for item in content_list
+            if isinstance(item, str)
+            or (
+                isinstance(item, dict)
+                and item.get("type") == "text"
+                and item.get("text")
+            )
+        )
 
     _RE_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
 
@@ -439,12 +462,13 @@ class TranscriptParser:
             pending_tools = dict(pending_tools)  # don't mutate caller's dict
 
         for data in entries:
-            msg_type = cls.get_message_type(data)
+            # Plain dict lookups: this loop runs for every new JSONL entry
+            msg_type = data.get("type")
             if msg_type not in ("user", "assistant"):
                 continue
 
             # Extract timestamp for this entry
-            entry_timestamp = cls.get_timestamp(data)
+            entry_timestamp = data.get("timestamp")
 
             message = data.get("message")
             if not isinstance(message, dict):
@@ -453,7 +477,10 @@ class TranscriptParser:
             if not isinstance(content, list):
                 content = [{"type": "text", "text": str(content)}] if content else []
 
-            parsed = cls.parse_message(data)
+            # Local command messages only ever come from user entries; skip
+            # parse_message's text extraction and regex passes for assistant
+            # entries, whose blocks are walked directly below.
+            parsed = cls.parse_message(data) if msg_type == "user" else None
 
             # Handle local command messages first
             if parsed:
@@ -743,7 +770,8 @@ class TranscriptParser:
         # Flush remaining pending tools at end.
         # In carry-over mode (monitor), keep them pending for the next call
         # without emitting entries. In one-shot mode (history), emit them.
-        remaining_pending = dict(pending_tools)
+        # pending_tools is already this call's own copy — return it as is.
+        remaining_pending = pending_tools
         if not _carry_over:
             for tool_id, tool_info in pending_tools.items():
                 result.append(
@@ -5,18 +5,24 @@ Provides:
   - atomic_write_json(): crash-safe JSON file writes via temp+rename.
   - read_cwd_from_jsonl(): extract the cwd field from the first JSONL entry.
   - find_ccbot_path(): locate the ccbot executable.
+  - list_tmux_windows(): (window_id, window_name) pairs from one tmux call.
+  - exec_tmux(): replace the current process with tmux (CLI attach).
 """
 
 import json
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 
 CCBOT_DIR_ENV = "CCBOT_DIR"
 
+# tmux binary resolved once; falls back to a PATH lookup at call time
+_TMUX_BIN = shutil.which("tmux") or "tmux"
+
 
 def ccbot_dir() -> Path:
     """Resolve config directory from CCBOT_DIR env var or default ~/.ccbot."""
@@ -75,6 +81,41 @@ def find_ccbot_path() -> str:
     return "ccbot"
 
 
+def list_tmux_windows(session_name: str) -> list[tuple[str, str]] | None:
+    """List (window_id, window_name) for a tmux session via one subprocess call.
+
+    Used by the standalone CLI commands, where going through libtmux would
+    spawn extra tmux processes for every window attribute read.
+    Returns None if the session does not exist or tmux is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            [
+                _TMUX_BIN,
+                "list-windows",
+                "-t",
+                f"={session_name}",
+                "-F",
+                "#{window_id}|#{window_name}",
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+
+    windows: list[tuple[str, str]] = []
+    for line in result.stdout.splitlines():
+        # window_id never contains "|", so split once from the left
+        wid, sep, name = line.partition("|")
+        if sep:
+            windows.append((wid, name))
+    return windows
+
+
 def read_cwd_from_jsonl(file_path: str | Path) -> str:
     """Read the cwd field from the first JSONL entry that has one.
 
@@ -96,3 +137,15 @@ def read_cwd_from_jsonl(file_path: str | Path) -> str:
     except OSError:
         pass
     return ""
+
+
+def exec_tmux(args: list[str]) -> NoReturn:
+    """Replace the current process with ``tmux <args>``.
+
+    Uses the binary resolved at import, so exec skips the PATH search.
+    """
+    argv = ["tmux", *args]
+    if os.path.isabs(_TMUX_BIN):
+        os.execv(_TMUX_BIN, argv)
+    else:
+        os.execvp("tmux", argv)
@@ -32,13 +32,19 @@ def mock_bot():
 @pytest.fixture
 def _clear_interactive_state():
     """Ensure interactive state is clean before and after each test."""
-    from ccbot.handlers.interactive_ui import _interactive_mode, _interactive_msgs
+    from ccbot.handlers.interactive_ui import (
+        _interactive_mode,
+        _interactive_msgs,
+        _interactive_rendered,
+    )
 
     _interactive_mode.clear()
     _interactive_msgs.clear()
+    _interactive_rendered.clear()
     yield
     _interactive_mode.clear()
     _interactive_msgs.clear()
+    _interactive_rendered.clear()
 
 
 @pytest.mark.usefixtures("_clear_interactive_state")
@@ -71,6 +77,32 @@ class TestHandleInteractiveUI:
         assert call_kwargs.kwargs["message_thread_id"] == 42
         assert call_kwargs.kwargs["reply_markup"] is not None
 
+    @pytest.mark.asyncio
+    async def test_unchanged_ui_skips_edit(
+        self, mock_bot: AsyncMock, sample_pane_settings: str
+    ):
+        """Re-rendering identical content does not edit the existing message."""
+        window_id = "@5"
+        mock_window = MagicMock()
+        mock_window.window_id = window_id
+
+        with (
+            patch("ccbot.handlers.interactive_ui.tmux_manager") as mock_tmux,
+            patch("ccbot.handlers.interactive_ui.session_manager") as mock_sm,
+        ):
+            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tmux.capture_pane = AsyncMock(return_value=sample_pane_settings)
+            mock_sm.resolve_chat_id.return_value = 100
+
+            for _ in range(2):
+                result = await handle_interactive_ui(
+                    mock_bot, user_id=1, window_id=window_id, thread_id=42
+                )
+
+        assert result is True
+        mock_bot.send_message.assert_called_once()
+        mock_bot.edit_message_text.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_no_ui_returns_false(self, mock_bot: AsyncMock):
         """Returns False when no interactive UI detected in pane."""
@@ -109,3 +141,9 @@ class TestKeyboardLayoutForSettings:
         assert any(CB_ASK_RIGHT in d for d in all_cb_data if d)
         assert any(CB_ASK_ESC in d for d in all_cb_data if d)
         assert any(CB_ASK_ENTER in d for d in all_cb_data if d)
+
+    def test_keyboard_is_memoized_per_window_and_layout(self):
+        """Repeated builds for the same window/UI reuse one markup instance."""
+        first = _build_interactive_keyboard("@5", ui_name="Settings")
+        assert _build_interactive_keyboard("@5", ui_name="Settings") is first
+        assert _build_interactive_keyboard("@5", ui_name="RestoreCheckpoint") != first
@@ -0,0 +1,86 @@
+"""Tests for message_queue status task coalescing."""
+
+import asyncio
+
+import pytest
+
+from ccbot.handlers.message_queue import MessageTask, _coalesce_status_tasks
+
+
+def _status(text: str, thread_id: int | None = 1) -> MessageTask:
+    return MessageTask(
+        task_type="status_update", text=text, window_id="@1", thread_id=thread_id
+    )
+
+
+class TestCoalesceStatusTasks:
+    @pytest.mark.asyncio
+    async def test_keeps_only_latest_status_for_thread(self):
+        queue: asyncio.Queue[MessageTask] = asyncio.Queue()
+        for text in ("b", "c"):
+            queue.put_nowait(_status(text))
+
+        latest, skipped = await _coalesce_status_tasks(
+            queue, _status("a"), asyncio.Lock()
+        )
+
+        assert latest.text == "c"
+        assert skipped == 2
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_content_task_stops_coalescing(self):
+        queue: asyncio.Queue[MessageTask] = asyncio.Queue()
+        content = MessageTask(task_type="content", window_id="@1", thread_id=1)
+        queue.put_nowait(content)
+        queue.put_nowait(_status("b"))
+
+        latest, skipped = await _coalesce_status_tasks(
+            queue, _status("a"), asyncio.Lock()
+        )
+
+        assert latest.text == "a"
+        assert skipped == 0
+        assert queue.qsize() == 2
+        assert queue.get_nowait() is content
+
+    @pytest.mark.asyncio
+    async def test_other_thread_is_not_coalesced(self):
+        queue: asyncio.Queue[MessageTask] = asyncio.Queue()
+        queue.put_nowait(_status("b", thread_id=2))
+
+        latest, skipped = await _coalesce_status_tasks(
+            queue, _status("a"), asyncio.Lock()
+        )
+
+        assert latest.text == "a"
+        assert skipped == 0
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_status_clear_is_not_swallowed(self):
+        queue: asyncio.Queue[MessageTask] = asyncio.Queue()
+        clear = MessageTask(task_type="status_clear", thread_id=1)
+        queue.put_nowait(_status("b"))
+
+        latest, skipped = await _coalesce_status_tasks(queue, clear, asyncio.Lock())
+
+        assert latest is clear
+        assert skipped == 0
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_status_clear_stops_coalescing(self):
+        queue: asyncio.Queue[MessageTask] = asyncio.Queue()
+        clear = MessageTask(task_type="status_clear", thread_id=1)
+        queue.put_nowait(clear)
+        queue.put_nowait(_status("b"))
+
+        latest, skipped = await _coalesce_status_tasks(
+            queue, _status("a"), asyncio.Lock()
+        )
+
+        assert latest.text == "a"
+        assert skipped == 0
+        assert queue.qsize() == 2
+        assert queue.get_nowait() is clear
@@ -0,0 +1,37 @@
+"""Tests for attach_session state file loading."""
+
+import json
+import os
+
+import pytest
+
+from ccbot import attach_session
+from ccbot.attach_session import _load_json_cached
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    attach_session._json_cache.clear()
+    yield
+    attach_session._json_cache.clear()
+
+
+class TestLoadJsonCached:
+    def test_unchanged_file_reuses_parsed_result(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"a": 1}))
+        first = _load_json_cached(path)
+        assert _load_json_cached(path) is first
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"a": 1}))
+        _load_json_cached(path)
+        path.write_text(json.dumps({"a": 22}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _load_json_cached(path) == {"a": 22}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            _load_json_cached(tmp_path / "missing.json")
@@ -33,6 +33,18 @@ class TestConfigValid:
         cfg = Config()
         assert cfg.monitor_poll_interval == 5.0
 
+    def test_max_poll_interval_not_below_poll_interval(self, monkeypatch):
+        monkeypatch.setenv("MONITOR_POLL_INTERVAL", "5.0")
+        monkeypatch.setenv("MONITOR_MAX_POLL_INTERVAL", "1.0")
+        cfg = Config()
+        assert cfg.monitor_max_poll_interval == 5.0
+
+    def test_custom_tmux_window_size(self, monkeypatch):
+        monkeypatch.setenv("CCBOT_TMUX_WIDTH", "120")
+        monkeypatch.setenv("CCBOT_TMUX_HEIGHT", "40")
+        cfg = Config()
+        assert (cfg.tmux_window_width, cfg.tmux_window_height) == (120, 40)
+
     def test_is_user_allowed_true(self):
         cfg = Config()
         assert cfg.is_user_allowed(12345) is True
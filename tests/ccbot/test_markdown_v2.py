@@ -56,3 +56,12 @@ class TestConvertMarkdown:
         assert ">inside quote||" in result
         assert "before" in result
         assert "after" in result
+
+    def test_repeated_text_is_memoized(self) -> None:
+        convert_markdown.cache_clear()
+        first = convert_markdown("**Select a window**")
+        hits = convert_markdown.cache_info().hits
+        second = convert_markdown("**Select a window**")
+        assert second == first
+        assert second is first
+        assert convert_markdown.cache_info().hits == hits + 1
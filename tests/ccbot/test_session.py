@@ -1,5 +1,8 @@
 """Tests for SessionManager pure dict operations."""
 
+import json
+from unittest.mock import AsyncMock
+
 import pytest
 
 from ccbot.session import SessionManager
@@ -33,6 +36,26 @@ class TestThreadBindings:
         assert result == {(100, 1, "@1"), (100, 2, "@2"), (200, 3, "@3")}
 
 
+class TestDeferredOffsetSave:
+    def test_offset_update_saved_only_on_save_if_dirty(
+        self, mgr: SessionManager, monkeypatch
+    ) -> None:
+        saves: list[None] = []
+
+        def fake_save(self) -> None:
+            saves.append(None)
+            self._dirty = False
+
+        monkeypatch.setattr(SessionManager, "_save_state", fake_save)
+        mgr.update_user_window_offset(100, "@1", 10)
+        mgr.update_user_window_offset(100, "@1", 20)
+        assert saves == []
+        mgr.save_if_dirty()
+        mgr.save_if_dirty()
+        assert len(saves) == 1
+        assert mgr.user_window_offsets[100]["@1"] == 20
+
+
 class TestGroupChatId:
     """Tests for group chat_id routing (supergroup forum topic support).
 
@@ -108,6 +131,86 @@ class TestWindowState:
         assert mgr.get_window_state("@1").session_id == ""
 
 
+class TestFindUsersForSession:
+    @pytest.mark.asyncio
+    async def test_matches_bound_windows_by_session_id(
+        self, mgr: SessionManager
+    ) -> None:
+        for wid, sid in (("@1", "sid-a"), ("@2", "sid-b"), ("@3", "sid-a")):
+            state = mgr.get_window_state(wid)
+            state.session_id = sid
+            state.cwd = "/tmp/proj"
+        mgr.bind_thread(100, 1, "@1")
+        mgr.bind_thread(100, 2, "@2")
+        mgr.bind_thread(200, 3, "@3")
+        result = await mgr.find_users_for_session("sid-a")
+        assert sorted(result) == [(100, "@1", 1), (200, "@3", 3)]
+
+    def test_window_ids_skip_states_without_cwd(self, mgr: SessionManager) -> None:
+        mgr.get_window_state("@1").session_id = "sid-a"
+        assert mgr.get_window_ids_for_session("sid-a") == set()
+
+
+class TestGetSessionFile:
+    def test_unknown_window_returns_none(self, mgr: SessionManager) -> None:
+        assert mgr.get_session_file("@9") is None
+
+    def test_builds_path_from_session_id_and_cwd(
+        self, mgr: SessionManager, monkeypatch, tmp_path
+    ) -> None:
+        from ccbot.config import config
+
+        monkeypatch.setattr(config, "claude_projects_path", tmp_path)
+        session_file = tmp_path / "-tmp-proj" / "sid-a.jsonl"
+        session_file.parent.mkdir()
+        session_file.write_text("{}\n")
+        state = mgr.get_window_state("@1")
+        state.session_id = "sid-a"
+        state.cwd = "/tmp/proj"
+        assert mgr.get_session_file("@1") == session_file
+
+
+class TestGetRecentMessagesByteRange:
+    @pytest.mark.asyncio
+    async def test_line_starting_before_end_byte_is_included(
+        self,
+        mgr: SessionManager,
+        monkeypatch,
+        tmp_path,
+        make_jsonl_entry,
+        make_text_block,
+    ) -> None:
+        lines = [
+            json.dumps(make_jsonl_entry(content=[make_text_block(t)])) + "\n"
+            for t in ("one", "two", "three")
+        ]
+        session_file = tmp_path / "sid-a.jsonl"
+        session_file.write_text("".join(lines), encoding="utf-8")
+        monkeypatch.setattr(mgr, "get_session_file", lambda wid: session_file)
+        mid_second = len(lines[0]) + len(lines[1]) // 2
+
+        messages, total = await mgr.get_recent_messages("@1", end_byte=mid_second)
+        tail, _ = await mgr.get_recent_messages("@1", start_byte=len(lines[0]))
+
+        assert [m["text"] for m in messages] == ["one", "two"]
+        assert total == 2
+        assert [m["text"] for m in tail] == ["two", "three"]
+
+
+class TestGetRecentMessagesResolution:
+    @pytest.mark.asyncio
+    async def test_reads_history_without_parsing_session_summary(
+        self, mgr: SessionManager, monkeypatch, tmp_path
+    ) -> None:
+        session_file = tmp_path / "sid-a.jsonl"
+        session_file.write_text("")
+        monkeypatch.setattr(mgr, "get_session_file", lambda wid: session_file)
+        resolve = AsyncMock()
+        monkeypatch.setattr(mgr, "resolve_session_for_window", resolve)
+        assert await mgr.get_recent_messages("@1") == ([], 0)
+        resolve.assert_not_awaited()
+
+
 class TestResolveWindowForThread:
     def test_none_thread_id_returns_none(self, mgr: SessionManager) -> None:
         assert mgr.resolve_window_for_thread(100, None) is None
@@ -1,11 +1,14 @@
 """Unit tests for SessionMonitor JSONL reading and offset handling."""
 
+import asyncio
 import json
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from ccbot.monitor_state import TrackedSession
-from ccbot.session_monitor import SessionMonitor
+from ccbot.session_monitor import NewMessage, SessionInfo, SessionMonitor
+from ccbot.transcript_parser import TranscriptParser
 
 
 class TestReadNewLinesOffsetRecovery:
@@ -93,3 +96,251 @@ class TestReadNewLinesOffsetRecovery:
         # Should reset offset to 0 and read the line
         assert session.last_byte_offset == jsonl_file.stat().st_size
         assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_unterminated_line_is_retried(
+        self, monitor, tmp_path, make_jsonl_entry
+    ):
+        """A line still being written is left for the next cycle."""
+        jsonl_file = tmp_path / "session.jsonl"
+        line1 = json.dumps(make_jsonl_entry(content="done")) + "\n"
+        jsonl_file.write_text(line1 + '{"parentUuid": "abc", "ty', encoding="utf-8")
+        session = TrackedSession(
+            session_id="test-session",
+            file_path=str(jsonl_file),
+            last_byte_offset=0,
+        )
+
+        result = await monitor._read_new_lines(
+            session, jsonl_file, file_size=jsonl_file.stat().st_size
+        )
+
+        assert len(result) == 1
+        assert session.last_byte_offset == len(line1.encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_non_message_lines_skipped_without_parsing(
+        self, monitor, tmp_path, make_jsonl_entry
+    ):
+        """Snapshot-style lines advance the offset but are never parsed."""
+        jsonl_file = tmp_path / "session.jsonl"
+        snapshot = json.dumps({"type": "file-history-snapshot", "snapshot": {}})
+        entry = json.dumps(make_jsonl_entry(content="hello"))
+        jsonl_file.write_text(snapshot + "\n" + entry + "\n", encoding="utf-8")
+        session = TrackedSession(
+            session_id="test-session",
+            file_path=str(jsonl_file),
+            last_byte_offset=0,
+        )
+
+        with patch.object(
+            TranscriptParser, "parse_line", wraps=TranscriptParser.parse_line
+        ) as parse_line:
+            result = await monitor._read_new_lines(session, jsonl_file)
+
+        assert len(result) == 1
+        assert parse_line.call_count == 1
+        assert session.last_byte_offset == jsonl_file.stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_read_error_keeps_offset_of_returned_entries(
+        self, monitor, tmp_path, make_jsonl_entry
+    ):
+        """Entries returned before a read error aren't re-read next cycle."""
+        jsonl_file = tmp_path / "session.jsonl"
+        line1 = json.dumps(make_jsonl_entry(content="first")) + "\n"
+        line2 = json.dumps(make_jsonl_entry(content="second")) + "\n"
+        jsonl_file.write_text(line1 + line2, encoding="utf-8")
+        session = TrackedSession(
+            session_id="test-session",
+            file_path=str(jsonl_file),
+            last_byte_offset=0,
+        )
+
+        parse_line = TranscriptParser.parse_line
+        calls = 0
+
+        def flaky_parse_line(line):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise OSError("read failed")
+            return parse_line(line)
+
+        with patch.object(TranscriptParser, "parse_line", flaky_parse_line):
+            result = await monitor._read_new_lines(session, jsonl_file)
+
+        assert len(result) == 1
+        assert session.last_byte_offset == len(line1.encode("utf-8"))
+
+
+class TestGetSessionFiles:
+    """Tests for reusing the last project scan between poll cycles."""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        return SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "monitor_state.json",
+        )
+
+    @pytest.mark.asyncio
+    async def test_known_sessions_skip_rescan(self, monitor, tmp_path):
+        info = SessionInfo(session_id="s1", file_path=tmp_path / "s1.jsonl")
+        with patch.object(
+            monitor, "scan_projects", AsyncMock(return_value=[info])
+        ) as scan:
+            assert await monitor._get_session_files({"s1"}) == [info]
+            assert await monitor._get_session_files({"s1"}) == [info]
+        scan.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_triggers_rescan(self, monitor, tmp_path):
+        info = SessionInfo(session_id="s1", file_path=tmp_path / "s1.jsonl")
+        with patch.object(
+            monitor, "scan_projects", AsyncMock(return_value=[info])
+        ) as scan:
+            await monitor._get_session_files({"s1"})
+            await monitor._get_session_files({"s1", "s2"})
+        assert scan.await_count == 2
+
+
+class TestPollBackoff:
+    """Tests for the idle poll interval backoff."""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        return SessionMonitor(
+            projects_path=tmp_path / "projects",
+            poll_interval=1.0,
+            max_poll_interval=3.0,
+            state_file=tmp_path / "monitor_state.json",
+        )
+
+    def test_idle_cycles_back_off_to_cap(self, monitor):
+        interval = 1.0
+        for _ in range(10):
+            interval = monitor._next_interval(interval, had_messages=False)
+        assert interval == 3.0
+
+    def test_new_messages_reset_interval(self, monitor):
+        assert monitor._next_interval(3.0, had_messages=True) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_wake_cuts_sleep_short(self, monitor):
+        monitor.wake()
+        assert await monitor._sleep(60) is True
+        assert await monitor._sleep(0) is False
+
+
+class TestLoadIndex:
+    """Tests for the (mtime, size)-keyed sessions-index.json cache."""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        return SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "monitor_state.json",
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_index_reuses_parse(self, monitor, tmp_path):
+        index_file = tmp_path / "sessions-index.json"
+        index_file.write_text(
+            json.dumps({"entries": [{"sessionId": "s1"}], "originalPath": "/p"})
+        )
+        first, original_path = await monitor._load_index(index_file)
+        second, _ = await monitor._load_index(index_file)
+        assert original_path == "/p"
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_modified_index_is_reparsed(self, monitor, tmp_path):
+        index_file = tmp_path / "sessions-index.json"
+        index_file.write_text(json.dumps({"entries": []}))
+        await monitor._load_index(index_file)
+        index_file.write_text(json.dumps({"entries": [{"sessionId": "s2"}]}))
+        entries, _ = await monitor._load_index(index_file)
+        assert entries == [{"sessionId": "s2"}]
+
+
+class TestScanProjects:
+    """Tests for project directory scanning."""
+
+    @pytest.mark.asyncio
+    async def test_indexed_and_unindexed_sessions_found(self, tmp_path):
+        projects = tmp_path / "projects"
+        project_dir = projects / "-work-proj"
+        project_dir.mkdir(parents=True)
+        (projects / "stray-file.txt").write_text("not a project")
+        cwd = tmp_path / "work"
+        cwd.mkdir()
+        indexed = project_dir / "s1.jsonl"
+        indexed.write_text("")
+        unindexed = project_dir / "s2.jsonl"
+        unindexed.write_text("")
+        (project_dir / "sessions-index.json").write_text(
+            json.dumps(
+                {
+                    "originalPath": str(cwd),
+                    "entries": [{"sessionId": "s1", "fullPath": str(indexed)}],
+                }
+            )
+        )
+        monitor = SessionMonitor(
+            projects_path=projects, state_file=tmp_path / "monitor_state.json"
+        )
+
+        with patch.object(
+            monitor, "_get_active_cwds", AsyncMock(return_value={str(cwd.resolve())})
+        ):
+            sessions = await monitor.scan_projects()
+
+        assert sorted((s.session_id, s.file_path) for s in sessions) == [
+            ("s1", indexed),
+            ("s2", unindexed),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_projects_path_returns_empty(self, tmp_path):
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "missing",
+            state_file=tmp_path / "monitor_state.json",
+        )
+        with patch.object(
+            monitor, "_get_active_cwds", AsyncMock(return_value={"/somewhere"})
+        ):
+            assert await monitor.scan_projects() == []
+
+
+class TestDispatchMessages:
+    """Tests for per-session ordered, cross-session concurrent delivery."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_delivered_concurrently_in_order(self, tmp_path):
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "monitor_state.json",
+        )
+        delivered: list[tuple[str, str]] = []
+        s2_started = asyncio.Event()
+
+        async def callback(msg: NewMessage) -> None:
+            if msg.session_id == "s2":
+                s2_started.set()
+            elif msg.text == "a1":
+                # Would deadlock if sessions were delivered one after another
+                await s2_started.wait()
+            delivered.append((msg.session_id, msg.text))
+
+        monitor.set_message_callback(callback)
+        messages = [
+            NewMessage(session_id="s1", text="a1", is_complete=True),
+            NewMessage(session_id="s1", text="a2", is_complete=True),
+            NewMessage(session_id="s2", text="b1", is_complete=True),
+        ]
+
+        await asyncio.wait_for(monitor._dispatch_messages(messages), timeout=1)
+
+        assert [t for sid, t in delivered if sid == "s1"] == ["a1", "a2"]
+        assert ("s2", "b1") in delivered
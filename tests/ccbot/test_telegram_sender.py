@@ -1,8 +1,8 @@
-"""Tests for telegram_sender.split_message."""
+"""Tests for telegram_sender.split_message and split_paragraphs."""
 
 import pytest
 
-from ccbot.telegram_sender import split_message
+from ccbot.telegram_sender import split_message, split_paragraphs
 
 
 class TestSplitMessage:
@@ -79,3 +79,25 @@ class TestSplitMessage:
         chunks = split_message(text, max_length=200)
         for chunk in chunks:
             assert len(chunk) <= 200
+
+    def test_line_of_exactly_max_length_yields_no_empty_chunk(self):
+        chunks = split_message("a" * 10 + "\n" + "b" * 10, max_length=10)
+        assert chunks == ["a" * 10, "b" * 10]
+
+
+class TestSplitParagraphs:
+    @pytest.mark.parametrize(
+        "paragraphs, max_len",
+        [
+            pytest.param([], 50, id="empty"),
+            pytest.param(["hello", "world"], 50, id="fits_one_chunk"),
+            pytest.param(["a" * 30, "b" * 30, "c\nd"], 50, id="paragraph_boundaries"),
+            pytest.param(["x" * 120, "tail"], 50, id="force_split_long_line"),
+            pytest.param(["", "a" * 40, ""], 20, id="empty_paragraphs"),
+        ],
+    )
+    def test_matches_split_message_on_joined_text(
+        self, paragraphs: list[str], max_len: int
+    ):
+        expected = split_message("\n\n".join(paragraphs), max_length=max_len)
+        assert split_paragraphs(paragraphs, max_length=max_len) == expected
@@ -22,13 +22,38 @@ class TestParseLine:
             ("not-json", None),
             ("", None),
             ("   \t  ", None),
+            (b'{"type": "user"}\n', {"type": "user"}),
+            (b"\xff\xfe{", None),
+        ],
+        ids=[
+            "valid_json",
+            "invalid_json",
+            "empty",
+            "whitespace",
+            "bytes",
+            "invalid_utf8_bytes",
         ],
-        ids=["valid_json", "invalid_json", "empty", "whitespace"],
     )
-    def test_parse_line(self, line: str, expected: dict | None):
+    def test_parse_line(self, line: str | bytes, expected: dict | None):
         assert TranscriptParser.parse_line(line) == expected
 
 
+class TestMayBeMessage:
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ('{"type":"assistant","message":{}}', True),
+            ('{"type": "user"}', True),
+            (b'{"type":"user"}', True),
+            ('{"type":"file-history-snapshot","snapshot":{}}', False),
+            (b'{"type":"summary"}', False),
+        ],
+        ids=["assistant", "spaced_user", "bytes_user", "snapshot", "bytes_summary"],
+    )
+    def test_may_be_message(self, line: str | bytes, expected: bool):
+        assert TranscriptParser.may_be_message(line) is expected
+
+
 # ── extract_text_only ────────────────────────────────────────────────────
 
 
@@ -50,8 +75,20 @@ class TestExtractTextOnly:
             ),
             ([], ""),
             (42, ""),
+            ([{"type": "text", "text": "only"}], "only"),
+            ([{"type": "tool_use", "name": "Read"}], ""),
+            (["bare"], "bare"),
+        ],
+        ids=[
+            "string",
+            "text_blocks",
+            "mixed",
+            "empty_list",
+            "non_list_non_string",
+            "single_text_block",
+            "single_non_text_block",
+            "single_string_item",
         ],
-        ids=["string", "text_blocks", "mixed", "empty_list", "non_list_non_string"],
     )
     def test_extract_text_only(self, content: list | str | int, expected: str):
         assert TranscriptParser.extract_text_only(content) == expected
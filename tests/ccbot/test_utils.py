@@ -1,11 +1,20 @@
-"""Tests for ccbot.utils: ccbot_dir, atomic_write_json, read_cwd_from_jsonl."""
+"""Tests for ccbot.utils: ccbot_dir, atomic_write_json, read_cwd_from_jsonl, etc."""
 
 import json
+import os
+import subprocess
 from pathlib import Path
 
 import pytest
 
-from ccbot.utils import atomic_write_json, ccbot_dir, read_cwd_from_jsonl
+from ccbot import utils
+from ccbot.utils import (
+    atomic_write_json,
+    ccbot_dir,
+    exec_tmux,
+    list_tmux_windows,
+    read_cwd_from_jsonl,
+)
 
 
 class TestCcbotDir:
@@ -70,3 +79,41 @@ class TestReadCwdFromJsonl:
 
     def test_missing_file_returns_empty(self, tmp_path: Path):
         assert read_cwd_from_jsonl(tmp_path / "nonexistent.jsonl") == ""
+
+
+class TestListTmuxWindows:
+    @staticmethod
+    def _fake_run(returncode: int, stdout: str):
+        def _run(args, **kwargs):
+            return subprocess.CompletedProcess(args, returncode, stdout, "")
+
+        return _run
+
+    def test_parses_id_and_name(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            subprocess, "run", self._fake_run(0, "@0|__main__\n@3|proj|x\n")
+        )
+        assert list_tmux_windows("ccbot") == [("@0", "__main__"), ("@3", "proj|x")]
+
+    def test_missing_session_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(subprocess, "run", self._fake_run(1, ""))
+        assert list_tmux_windows("ccbot") is None
+
+    def test_tmux_not_installed_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+        def _raise(*args, **kwargs):
+            raise FileNotFoundError("tmux")
+
+        monkeypatch.setattr(subprocess, "run", _raise)
+        assert list_tmux_windows("ccbot") is None
+
+
+class TestExecTmux:
+    def test_execs_resolved_binary_without_path_search(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        calls: list[tuple[str, list[str]]] = []
+        monkeypatch.setattr(utils, "_TMUX_BIN", "/usr/bin/tmux")
+        monkeypatch.setattr(os, "execv", lambda path, argv: calls.append((path, argv)))
+        monkeypatch.setattr(os, "execvp", lambda *a: pytest.fail("PATH search used"))
+        exec_tmux(["switch-client", "-t", "ccbot:@1"])
+        assert calls == [("/usr/bin/tmux", ["tmux", "switch-client", "-t", "ccbot:@1"])]